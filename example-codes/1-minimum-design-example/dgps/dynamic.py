@@ -12,6 +12,7 @@ Classes:
 """
 
 import numpy as np
+from scipy.signal import lfilter
 
 
 class DynamicNormalDGP:
@@ -21,20 +22,29 @@ class DynamicNormalDGP:
     Attributes:
         beta0 (float): Intercept term. Defaults to 0.0.
         beta1 (float): AR(1) coefficient. Defaults to 0.5.
+        dtype (type[np.floating]): Floating point type of sampled data.
+            Defaults to np.float32.
     """
 
-    def __init__(self, beta0: float = 0.0, beta1: float = 0.5): 
+    def __init__(
+        self,
+        beta0: float = 0.0,
+        beta1: float = 0.5,
+        dtype: type[np.floating] = np.float32,
+    ):
         self.beta0: float = beta0
         self.beta1: float = beta1
+        self.dtype: type[np.floating] = dtype
 
     def sample(
-        self, n_obs: int, seed: int | None = None
+        self, n_obs: int, seed: int | np.random.Generator | None = None
     ) -> tuple[np.ndarray, np.ndarray]:
         """Samples data from the dynamic DGP.
 
         Args:
             n_obs (int): Number of observations to sample.
-            seed (int, optional): Random seed for reproducibility. Defaults to None.
+            seed (int | np.random.Generator, optional): Random seed or generator
+                for reproducibility. Defaults to None.
 
         Returns:
             tuple: (x, y) arrays, each of length n_obs.
@@ -42,12 +52,53 @@ class DynamicNormalDGP:
         """
         rng = np.random.default_rng(seed)
 
-        # Draw y
-        y = np.zeros(n_obs + 1)  # With an extra observation for lag
-        u = rng.normal(size=n_obs + 1)
-        y[0] = self.beta0 + u[0]  # Initial condition
-        for t in range(1, n_obs + 1):
-            y[t] = self.beta0 + self.beta1 * y[t - 1] + u[t]
+        # Draw y, with an extra observation for lag
+        y = self._filter(rng.standard_normal(n_obs + 1, dtype=self.dtype))
 
         # Return lagged y as x and y[1:] as y
         return y[:-1], y[1:]
+
+    def sample_many(
+        self, n_sim: int, n_obs: int, seed: int | np.random.Generator | None = None
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Samples n_sim independent trajectories from the dynamic DGP at once.
+
+        Args:
+            n_sim (int): Number of trajectories to sample.
+            n_obs (int): Number of observations in each trajectory.
+            seed (int | np.random.Generator, optional): Random seed or generator
+                for reproducibility. Defaults to None.
+
+        Returns:
+            tuple: (x, y) arrays, each of shape (n_sim, n_obs). Row i is the
+                i-th trajectory, with x the lag of y as in sample().
+        """
+        rng = np.random.default_rng(seed)
+
+        # Filter all trajectories in one call along the time axis
+        y = self._filter(rng.standard_normal((n_sim, n_obs + 1), dtype=self.dtype))
+        return y[:, :-1], y[:, 1:]
+
+    def _filter(self, shocks: np.ndarray) -> np.ndarray:
+        """Turns shocks u into AR(1) paths along the last axis.
+
+        The recursion
+            y_t = beta1 * y_{t-1} + (beta0 + u_t),  y_0 = beta0 + u_0
+        is a first-order IIR filter applied to beta0 + u. The intercept is
+        added in place, so the filter input reuses the buffer of the draws.
+        Filter coefficients share the dtype of u so that the output is not
+        upcast.
+
+        Args:
+            shocks (np.ndarray): Draws of u; overwritten.
+
+        Returns:
+            np.ndarray: y, same shape as shocks.
+        """
+        shocks += self.beta0
+        return lfilter(
+            np.ones(1, dtype=self.dtype),
+            np.array([1.0, -self.beta1], dtype=self.dtype),
+            shocks,
+            axis=-1,
+        )
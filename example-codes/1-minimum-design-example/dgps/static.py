@@ -20,26 +20,61 @@ class StaticNormalDGP:
     Attributes:
         beta0 (float): Intercept term. Defaults on 0.0.
         beta1 (float): Slope coefficient. Defaults to 0.5.
+        dtype (type[np.floating]): Floating point type of sampled data.
+            Defaults to np.float32, which is ample for bias estimates and halves
+            memory traffic relative to np.float64.
     """
 
-    def __init__(self, beta0: float = 0.0, beta1: float = 0.5) -> None:
+    def __init__(
+        self,
+        beta0: float = 0.0,
+        beta1: float = 0.5,
+        dtype: type[np.floating] = np.float32,
+    ) -> None:
         self.beta0: float = beta0
         self.beta1: float = beta1
+        self.dtype: type[np.floating] = dtype
 
     def sample(
-        self, n_obs: int, seed: int | None = None
+        self, n_obs: int, seed: int | np.random.Generator | None = None
     ) -> tuple[np.ndarray, np.ndarray]:
         """Samples data from the static DGP.
 
         Args:
             n_obs (int): Number of observations to sample.
-            seed (int, optional): Random seed for reproducibility. Defaults to None.
+            seed (int | np.random.Generator, optional): Random seed or generator
+                for reproducibility. Defaults to None.
 
         Returns:
             tuple: (x, y) arrays, each of length n_obs.
         """
         rng = np.random.default_rng(seed)
-        x = rng.normal(size=n_obs)
-        u = rng.normal(size=n_obs)
+        x = rng.standard_normal(n_obs, dtype=self.dtype)
+        u = rng.standard_normal(n_obs, dtype=self.dtype)
+        y = self.beta0 + self.beta1 * x + u
+        return x, y
+
+    def sample_many(
+        self, n_sim: int, n_obs: int, seed: int | np.random.Generator | None = None
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Samples n_sim independent datasets from the static DGP at once.
+
+        Args:
+            n_sim (int): Number of datasets to sample.
+            n_obs (int): Number of observations in each dataset.
+            seed (int | np.random.Generator, optional): Random seed or generator
+                for reproducibility. A CuPy generator is used as is, so that
+                the data are drawn on the GPU. Defaults to None.
+
+        Returns:
+            tuple: (x, y) arrays, each of shape (n_sim, n_obs). Row i is the
+                i-th dataset.
+        """
+        if hasattr(seed, "standard_normal"):
+            rng = seed
+        else:
+            rng = np.random.default_rng(seed)
+        x = rng.standard_normal((n_sim, n_obs), dtype=self.dtype)
+        u = rng.standard_normal((n_sim, n_obs), dtype=self.dtype)
         y = self.beta0 + self.beta1 * x + u
         return x, y
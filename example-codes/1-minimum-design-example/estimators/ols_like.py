@@ -10,11 +10,10 @@ All estimators implement the EstimatorProtocol interface.
 Classes:
     SimpleOLS: ordinary least squares estimator.
     SimpleRidge: ridge regression estimator.
-    LassoWrapper: wrapper for scikit-learn's Lasso estimator.
+    LassoWrapper: Lasso estimator matching scikit-learn's Lasso.
 """
 
 import numpy as np
-from sklearn.linear_model import Lasso as SklearnLasso
 
 
 class SimpleOLS:
@@ -37,11 +36,28 @@ class SimpleOLS:
             y (np.ndarray): Dependent variable (1D array).
         """
 
-        # Add constant to x
-        X = np.column_stack([np.ones(len(x)), x])
-        # OLS estimation
-        beta_hat = np.linalg.inv(X.T @ X) @ X.T @ y
-        self.beta0_hat, self.beta1_hat = beta_hat[0], beta_hat[1]
+        # With a single covariate OLS reduces to slope = cov(x, y) / var(x).
+        # Demeaned x sums to zero, so y itself need not be demeaned
+        x_mean, y_mean = x.mean(), y.mean()
+        x_demeaned = x - x_mean
+        self.beta1_hat = (x_demeaned @ y) / (x_demeaned @ x_demeaned)
+        self.beta0_hat = y_mean - self.beta1_hat * x_mean
+
+    def fit_many(self, x: np.ndarray, y: np.ndarray) -> np.ndarray:
+        """Fit OLS to a batch of datasets and return the slope estimates.
+
+        Args:
+            x (np.ndarray): Independent variable, shape (n_sim, n_obs).
+            y (np.ndarray): Dependent variable, shape (n_sim, n_obs).
+
+        Returns:
+            np.ndarray: Estimated slope for each dataset, shape (n_sim,).
+        """
+        # Row-wise dot products via einsum avoid (n_sim, n_obs) temporaries
+        x_demeaned = x - x.mean(axis=1, keepdims=True)
+        return np.einsum("ij,ij->i", x_demeaned, y) / np.einsum(
+            "ij,ij->i", x_demeaned, x_demeaned
+        )
 
 
 class SimpleRidge:
@@ -57,6 +73,9 @@ class SimpleRidge:
         self.beta0_hat: float = np.nan
         self.beta1_hat: float = np.nan
         self.reg_param = reg_param
+        # Sums (n, sum x, sum x^2, sum y, sum xy) of the last fitted data,
+        # reused by refit()
+        self._moments: tuple[float, float, float, float, float] | None = None
 
     def fit(self, x: np.ndarray, y: np.ndarray) -> None:
         """Fits the ridge estimator to the provided data.
@@ -66,26 +85,76 @@ class SimpleRidge:
             y (np.ndarray): Dependent variable (1D array).
         """
 
-        # Add constant to x
-        X = np.column_stack([np.ones(len(x)), x])
-        # OLS estimation
-        beta_hat = np.linalg.inv(X.T @ X + self.reg_param * np.eye(2)) @ X.T @ y
-        self.beta0_hat, self.beta1_hat = beta_hat[0], beta_hat[1]
+        # The 2x2 normal equations only need these sums, so the (n, 2)
+        # design matrix is never materialized
+        self._moments = (len(x), x.sum(), x @ x, y.sum(), x @ y)
+        self._solve()
+
+    def refit(self, reg_param: float) -> None:
+        """Refits to the data last passed to fit() with a new regularization.
+
+        Reuses the cached X'X and X'y, so the cost does not depend on the
+        sample size. Useful for sweeping over a regularization path.
+
+        Args:
+            reg_param (float): New strength of regularization.
+
+        Raises:
+            ValueError: if fit() has not been called yet.
+        """
+        if self._moments is None:
+            raise ValueError("fit() must be called before refit()")
+        self.reg_param = reg_param
+        self._solve()
+
+    def _solve(self) -> None:
+        """Solves the penalized normal equations using the cached sums.
+
+        The system is 2x2, so it is solved by Cramer's rule instead of a
+        LAPACK call.
+        """
+        n_obs, x_sum, xx, y_sum, xy = self._moments
+        s00 = n_obs + self.reg_param
+        s11 = xx + self.reg_param
+        det = s00 * s11 - x_sum * x_sum
+        self.beta0_hat = (s11 * y_sum - x_sum * xy) / det
+        self.beta1_hat = (s00 * xy - x_sum * y_sum) / det
+
+    def fit_many(self, x: np.ndarray, y: np.ndarray) -> np.ndarray:
+        """Fits the ridge estimator to a batch of datasets.
+
+        Args:
+            x (np.ndarray): Independent variable, shape (n_sim, n_obs).
+            y (np.ndarray): Dependent variable, shape (n_sim, n_obs).
+
+        Returns:
+            np.ndarray: Estimated slope for each dataset, shape (n_sim,).
+        """
+        # Cramer's rule on each dataset's 2x2 penalized system, vectorized
+        # over datasets
+        x_sum = x.sum(axis=1)
+        s00 = x.shape[1] + self.reg_param
+        s11 = np.einsum("ij,ij->i", x, x) + self.reg_param
+        det = s00 * s11 - x_sum * x_sum
+        return (s00 * np.einsum("ij,ij->i", x, y) - x_sum * y.sum(axis=1)) / det
 
 
 class LassoWrapper:
-    """A wrapper for scikit-learn's Lasso to match the EstimatorProtocol.
-    Model y = beta0 + beta1*x+u.
+    """A Lasso estimator for the model y = beta0 + beta1*x+u.
+
+    Minimizes the same objective as scikit-learn's Lasso with an unpenalized
+    intercept:
+        (1 / (2n)) * ||y - beta0 - beta1*x||^2 + reg_param * |beta1|
+    With a single covariate the minimizer has a closed form (soft thresholding),
+    so no iterative solver is needed.
 
     Attributes:
-        model (sklearn.linear_model.Lasso): a scikit-learn Lasso instance.
         beta0_hat (float): Estimated intercept. Initialized as np.nan.
         beta1_hat (float): Estimated slope. Initialized as np.nan.
         reg_param (float): Regularization strength (alpha). Defaults to 1.0.
     """
 
     def __init__(self, reg_param: float = 1.0) -> None:
-        self.model = SklearnLasso(alpha=reg_param)
         self.beta0_hat: float = np.nan
         self.beta1_hat: float = np.nan
         self.reg_param = reg_param
@@ -97,7 +166,26 @@ class LassoWrapper:
             x (np.ndarray): Independent variable (1D array).
             y (np.ndarray): Dependent variable (1D array).
         """
-        x = x.reshape(-1, 1)  # sklearn expects 2d array inputs
-        self.model.fit(x, y)
-        self.beta0_hat = float(self.model.intercept_)
-        self.beta1_hat = float(self.model.coef_[0])
+        # Soft-threshold the OLS slope numerator on demeaned data
+        x_mean, y_mean = x.mean(), y.mean()
+        x_demeaned = x - x_mean
+        xty = (x_demeaned @ y) / len(x)
+        xtx = (x_demeaned @ x_demeaned) / len(x)
+        self.beta1_hat = np.sign(xty) * max(abs(xty) - self.reg_param, 0.0) / xtx
+        self.beta0_hat = y_mean - self.beta1_hat * x_mean
+
+    def fit_many(self, x: np.ndarray, y: np.ndarray) -> np.ndarray:
+        """Fits the Lasso model to a batch of datasets.
+
+        Args:
+            x (np.ndarray): Independent variable, shape (n_sim, n_obs).
+            y (np.ndarray): Dependent variable, shape (n_sim, n_obs).
+
+        Returns:
+            np.ndarray: Estimated slope for each dataset, shape (n_sim,).
+        """
+        # Row-wise version of the soft thresholding in fit()
+        x_demeaned = x - x.mean(axis=1, keepdims=True)
+        xty = np.einsum("ij,ij->i", x_demeaned, y) / x.shape[1]
+        xtx = np.einsum("ij,ij->i", x_demeaned, x_demeaned) / x.shape[1]
+        return np.sign(xty) * np.maximum(np.abs(xty) - self.reg_param, 0.0) / xtx
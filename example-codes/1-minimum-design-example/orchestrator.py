@@ -21,11 +21,14 @@ class SimulationOrchestrator:
             simulations to run, sample size, first seed.
         summary_results (dict): simulation results for each scenario, as returned
             by corresponding simulation runner
+        n_jobs (int): number of worker processes each runner may use for its
+            Monte Carlo loop. Defaults to 1.
     """
 
-    def __init__(self, scenarios: list[SimulationScenario]):
+    def __init__(self, scenarios: list[SimulationScenario], n_jobs: int = 1):
         self.scenarios = scenarios
         self.summary_results = {}
+        self.n_jobs = n_jobs
 
     def run_all(self):
         for scenario in self.scenarios:
@@ -39,6 +42,7 @@ class SimulationOrchestrator:
                 n_sim=scenario.n_simulations,
                 n_obs=scenario.sample_size,
                 first_seed=scenario.first_seed,
+                n_jobs=self.n_jobs,
             )
             # Save results
             self.summary_results[scenario.name] = runner.errors.mean()
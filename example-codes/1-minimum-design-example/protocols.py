@@ -9,10 +9,14 @@ simple linear-like estimators with one covariate.
 Protocols:
     DGPProtocol: Interface for data-generating processes.
     EstimatorProtocol: Interface for estimators.
+    BatchDGPProtocol: Optional interface for DGPs that can draw many samples
+        at once.
+    BatchEstimatorProtocol: Optional interface for estimators that can fit
+        many samples at once.
 """
 
 
-from typing import Protocol
+from typing import Protocol, runtime_checkable
 
 import numpy as np
 
@@ -26,8 +30,20 @@ class EstimatorProtocol(Protocol):
 
 class DGPProtocol(Protocol):
     def sample(
-        self, n_obs: int, seed: int | None = None
+        self, n_obs: int, seed: int | np.random.Generator | None = None
     ) -> tuple[np.ndarray, np.ndarray]: ...
 
     @property
     def beta1(self) -> float: ...
+
+
+@runtime_checkable
+class BatchEstimatorProtocol(Protocol):
+    def fit_many(self, x: np.ndarray, y: np.ndarray) -> np.ndarray: ...
+
+
+@runtime_checkable
+class BatchDGPProtocol(Protocol):
+    def sample_many(
+        self, n_sim: int, n_obs: int, seed: int | np.random.Generator | None = None
+    ) -> tuple[np.ndarray, np.ndarray]: ...
@@ -9,9 +9,59 @@ Classes:
     SimulationRunner: Runs simulations and summarizes results.
 """
 
+from functools import partial
+
 import numpy as np
+from joblib import Parallel, delayed
+
+from protocols import (
+    BatchDGPProtocol,
+    BatchEstimatorProtocol,
+    DGPProtocol,
+    EstimatorProtocol,
+)
+
+
+def _estimation_error(
+    estimator: EstimatorProtocol, x: np.ndarray, y: np.ndarray, beta1: float
+) -> float:
+    """Fits the estimator to one dataset and returns the estimation error.
+
+    Defined at module level so that it can be pickled and sent to worker
+    processes.
+
+    Args:
+        estimator (EstimatorProtocol): estimator to fit.
+        x (np.ndarray): independent variable.
+        y (np.ndarray): dependent variable.
+        beta1 (float): true slope.
+
+    Returns:
+        float: estimation error beta1_hat - beta1.
+    """
+    estimator.fit(x, y)
+    return estimator.beta1_hat - beta1
+
 
-from protocols import DGPProtocol, EstimatorProtocol
+def _simulate_one(
+    dgp: DGPProtocol,
+    estimator: EstimatorProtocol,
+    n_obs: int,
+    rng: np.random.Generator,
+) -> float:
+    """Draws one dataset, fits the estimator, and returns the estimation error.
+
+    Args:
+        dgp (DGPProtocol): data-generating process to sample from.
+        estimator (EstimatorProtocol): estimator to fit.
+        n_obs (int): number of observations in the dataset.
+        rng (np.random.Generator): random number generator for the draw.
+
+    Returns:
+        float: estimation error beta1_hat - beta1.
+    """
+    x, y = dgp.sample(n_obs, seed=rng)
+    return _estimation_error(estimator, x, y, dgp.beta1)
 
 
 class SimulationRunner:
@@ -35,7 +85,14 @@ class SimulationRunner:
         self.estimator: EstimatorProtocol = estimator
         self.errors: np.ndarray = np.empty(0)
 
-    def simulate(self, n_sim: int, n_obs: int, first_seed: int | None = None) -> None:
+    def simulate(
+        self,
+        n_sim: int,
+        n_obs: int,
+        first_seed: int | None = None,
+        n_jobs: int = 1,
+        use_gpu: bool = False,
+    ) -> None:
         """Runs simulations and stores estimation errors.
 
         Args:
@@ -43,20 +100,95 @@ class SimulationRunner:
             n_obs (int): Number of observations per simulation.
             first_seed (int | None): Starting random seed for reproducibility.
                 Defaults to None.
+            n_jobs (int): number of worker processes for the per-draw loop;
+                -1 uses all cores. Defaults to 1 (run in the current process).
+            use_gpu (bool): draw and fit all datasets on the GPU with CuPy.
+                Requires CuPy, a batched DGP whose sample_many() accepts a
+                CuPy generator, and a batched estimator. Defaults to False.
+
+        Raises:
+            ValueError: if use_gpu is set but the DGP or the estimator has
+                no batched method.
         """
-        # Preallocate array to hold estimation errors
-        self.errors = np.empty(n_sim)
-
-        # Run simulation
-        for sim_id in range(n_sim):
-            # Draw data
-            x, y = self.dgp.sample(
-                n_obs, seed=first_seed + sim_id if first_seed else None
+        if use_gpu:
+            self.errors = self._simulate_gpu(n_sim, n_obs, first_seed)
+            return
+
+        if isinstance(self.dgp, BatchDGPProtocol):
+            # Draw all datasets at once from a single generator
+            x, y = self.dgp.sample_many(n_sim, n_obs, seed=first_seed)
+            # Fast path: fit them in one vectorized pass if possible
+            if isinstance(self.estimator, BatchEstimatorProtocol):
+                # Errors are stored in float64 on every path, whatever the
+                # dtype of the data
+                self.errors = (
+                    self.estimator.fit_many(x, y) - self.dgp.beta1
+                ).astype(np.float64)
+                return
+            # Otherwise fit each dataset (a row view) separately
+            tasks = (
+                partial(_estimation_error, self.estimator, x_i, y_i, self.dgp.beta1)
+                for x_i, y_i in zip(x, y)
+            )
+        else:
+            # Draw and fit each dataset separately. All draws share one bit
+            # generator: draw i uses its i-th jumped copy, a non-overlapping
+            # substream, instead of reseeding a fresh generator every time
+            bit_generator = np.random.PCG64(first_seed)
+            tasks = (
+                partial(
+                    _simulate_one,
+                    self.dgp,
+                    self.estimator,
+                    n_obs,
+                    np.random.Generator(bit_generator.jumped(sim_id)),
+                )
+                for sim_id in range(n_sim)
+            )
+
+        # Run simulation. Draws are independent, so they may be spread over
+        # worker processes; each worker fits its own copy of the estimator
+        if n_jobs == 1:
+            errors = (task() for task in tasks)
+        else:
+            errors = Parallel(n_jobs=n_jobs, backend="loky")(
+                delayed(task)() for task in tasks
+            )
+        self.errors = np.fromiter(errors, dtype=np.float64, count=n_sim)
+
+    def _simulate_gpu(
+        self, n_sim: int, n_obs: int, first_seed: int | None
+    ) -> np.ndarray:
+        """Runs the batched simulation on the GPU.
+
+        Data are drawn and fitted on the device; only the vector of estimation
+        errors is copied back to the host.
+
+        Args:
+            n_sim (int): number of simulations to run.
+            n_obs (int): Number of observations per simulation.
+            first_seed (int | None): random seed for the CuPy generator.
+
+        Returns:
+            np.ndarray: estimation errors, shape (n_sim,).
+        """
+        if not (
+            isinstance(self.dgp, BatchDGPProtocol)
+            and isinstance(self.estimator, BatchEstimatorProtocol)
+        ):
+            raise ValueError(
+                "use_gpu requires a DGP with sample_many() and an estimator "
+                "with fit_many()"
             )
-            # Fit model
-            self.estimator.fit(x, y)
-            # Store error
-            self.errors[sim_id] = self.estimator.beta1_hat - self.dgp.beta1
+        # Optional dependency, only needed on this path
+        import cupy
+
+        x, y = self.dgp.sample_many(
+            n_sim, n_obs, seed=cupy.random.default_rng(first_seed)
+        )
+        return cupy.asnumpy(self.estimator.fit_many(x, y) - self.dgp.beta1).astype(
+            np.float64
+        )
 
     def summarize_bias(self) -> None:
         """Prints the average estimation error (bias) for beta1."""
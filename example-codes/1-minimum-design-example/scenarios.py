@@ -22,7 +22,7 @@ from estimators.ols_like import LassoWrapper, SimpleOLS, SimpleRidge
 from protocols import DGPProtocol, EstimatorProtocol
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SimulationScenario:
     """A single simulation scenario: DGP, estimator, and sample size."""
 
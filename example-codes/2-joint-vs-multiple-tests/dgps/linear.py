@@ -8,8 +8,37 @@ Classes:
         adjustable correlation between covariates, and two variables + constant.
 """
 
+from functools import lru_cache
+
 import numpy as np
-import pandas as pd
+
+
+@lru_cache(maxsize=1)
+def _draw_standard_normals(
+    n_sim: int, n_obs: int, seed: int
+) -> tuple[np.ndarray, np.ndarray]:
+    """Draws the standard normals behind BivariateLinearModel.sample_many().
+
+    The draws do not depend on the parameters of the DGP, so DGPs that share
+    a seed and sample size reuse the same arrays instead of drawing them
+    again. The arrays are read-only, as they are shared.
+
+    Args:
+        n_sim (int): Number of datasets.
+        n_obs (int): Number of observations in each dataset.
+        seed (int): Random seed.
+
+    Returns:
+        tuple: (covariate, residual) draws of shapes (n_sim, n_obs, 2) and
+            (n_sim, n_obs).
+    """
+    rng = np.random.default_rng(seed)
+    covar_draws = rng.standard_normal((n_sim, n_obs, 2))
+    resid_draws = rng.standard_normal((n_sim, n_obs))
+    covar_draws.flags.writeable = False
+    resid_draws.flags.writeable = False
+    return covar_draws, resid_draws
+
 
 class BivariateLinearModel:
     """A data-generating process (DGP) for a static linear model
@@ -23,44 +52,72 @@ class BivariateLinearModel:
         self.common_coef_val: float = common_coef_val
         self.covar_corr: float = covar_corr
 
+        # Cholesky factor of the covariance of the two non-constant
+        # covariates. Computed once here instead of decomposing the
+        # covariance on every draw
+        self._covar_chol: np.ndarray = np.linalg.cholesky(
+            np.array([[1, covar_corr], [covar_corr, 1]])
+        )
+
     def sample(
-        self, n_obs: int, seed: int | None = None
-    ) -> tuple[pd.DataFrame, pd.DataFrame]:
+        self, n_obs: int, seed: int | np.random.Generator | None = None
+    ) -> tuple[np.ndarray, np.ndarray]:
         """Samples data from the static DGP.
 
         Args:
             n_obs (int): Number of observations to sample.
-            seed (int, optional): Random seed for reproducibility. Defaults to None.
+            seed (int | np.random.Generator, optional): Random seed or
+                generator for reproducibility. Defaults to None.
 
         Returns:
-            tuple: (x, y) DataFrames, each of length n_obs.
+            tuple: (x, y) arrays, each of length n_obs. x has a leading
+                constant column.
         """
         # Initialize RNG
         rng = np.random.default_rng(seed)
 
-        # Construct mean and covariance for coefficients
-        x_mean = np.array([1, 0, 0])
-        x_covar = np.array([[0, 0, 0], [0, 1, self.covar_corr], [0, self.covar_corr, 1]])
-
         # Construct vector of coefficients
-        thetas = np.array([1, self.common_coef_val, self.common_coef_val]
-                          )
-        # Draw covariates and residuals, combine into output 
-        covariates = rng.multivariate_normal(
-            x_mean,
-            x_covar,
-            size=n_obs,
-        )
+        thetas = np.array([1, self.common_coef_val, self.common_coef_val])
+
+        # Draw covariates and residuals, combine into output. Correlated
+        # covariates are a linear transform of independent standard normals,
+        # preceded by the constant column
+        covariates = np.ones((n_obs, 3))
+        covariates[:, 1:] = rng.standard_normal((n_obs, 2)) @ self._covar_chol.T
         resids = rng.normal(0, np.sqrt(1), size=n_obs)
         y = (covariates @ thetas) + resids
 
-        # Convert output into pandas dataframes with dynamic variable names for X
-        covariates_df = pd.DataFrame(
-            covariates,
-            columns=[f"X{i}" for i in range(covariates.shape[1])],
-        )
-        y_df = pd.DataFrame(
-            y,
-            columns=["y"],
-        )
-        return covariates_df, y_df
\ No newline at end of file
+        return covariates, y
+
+    def sample_many(
+        self, n_sim: int, n_obs: int, seed: int | None = None
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Samples n_sim independent datasets from the static DGP at once.
+
+        Args:
+            n_sim (int): Number of datasets to sample.
+            n_obs (int): Number of observations in each dataset.
+            seed (int, optional): Random seed for reproducibility. Defaults to None.
+
+        Returns:
+            tuple: (x, y) arrays of shapes (n_sim, n_obs, 3) and (n_sim, n_obs).
+                Entry i along the first axis is the i-th dataset.
+        """
+        # Draw standard normals. With a fixed seed all scenarios of a sweep
+        # share them, so they are only drawn once
+        if seed is None:
+            rng = np.random.default_rng()
+            covar_draws = rng.standard_normal((n_sim, n_obs, 2))
+            resid_draws = rng.standard_normal((n_sim, n_obs))
+        else:
+            covar_draws, resid_draws = _draw_standard_normals(n_sim, n_obs, seed)
+
+        # Construct vector of coefficients
+        thetas = np.array([1, self.common_coef_val, self.common_coef_val])
+
+        # Same construction as in sample(), with a leading axis over datasets
+        covariates = np.ones((n_sim, n_obs, 3))
+        covariates[..., 1:] = covar_draws @ self._covar_chol.T
+        y = (covariates @ thetas) + resid_draws
+
+        return covariates, y
@@ -26,7 +26,7 @@ from sim_infrastructure.orchestrators import SimulationOrchestratorParallel
 from sim_infrastructure.results_processor import ResultsProcessor
 from sim_infrastructure.scenarios import scenarios
 
-SIM_RESULTS_PATH = Path() / "results" / "sim_results.csv"
+SIM_RESULTS_PATH = Path() / "results" / "sim_results.parquet"
 PLOT_FOLDER = Path() / "results" / "plots"
 
 
@@ -35,8 +35,10 @@ if __name__ == "__main__":
     orchestrator = SimulationOrchestratorParallel(scenarios)
     orchestrator.run_all()
 
-    # Export results
-    pd.DataFrame(orchestrator.summary_results).to_csv(SIM_RESULTS_PATH)
+    # Export results. Only two test names occur, so store them as categories
+    sim_results = pd.DataFrame(orchestrator.summary_results)
+    sim_results["test"] = sim_results["test"].astype("category")
+    sim_results.to_parquet(SIM_RESULTS_PATH, compression="zstd")
 
     # Export plots
     results_processor = ResultsProcessor(SIM_RESULTS_PATH, PLOT_FOLDER)
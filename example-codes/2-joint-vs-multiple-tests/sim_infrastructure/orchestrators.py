@@ -6,7 +6,8 @@ Classes:
     SimulationOrchestratorSequential: runs simulations sequentially
 """
 
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 
 from tqdm import tqdm
 
@@ -22,15 +23,20 @@ class SimulationOrchestratorParallel:
             scenario: DGP and estimator type, associated parameters, number of
             simulations to run, sample size, first seed.
         summary_results (list): simulation results for each scenario, as
-            returned by corresponding simulation runner.
+            returned by corresponding simulation runner, in scenario order.
     """
 
     def __init__(self, scenarios: list[SimulationScenario]) -> None:
         self.scenarios = scenarios
         self.summary_results = []
 
-    def _run_single_scenario(self, scenario: SimulationScenario):
-        """Run a single scenario and return the results."""
+    @staticmethod
+    def _run_single_scenario(scenario: SimulationScenario):
+        """Run a single scenario and return the results.
+
+        A static method, so that sending it to a worker process does not
+        require pickling the orchestrator and its full list of scenarios.
+        """
 
         dgp = scenario.dgp(**scenario.dgp_params)
         estimator = scenario.test(**scenario.test_params)
@@ -44,24 +50,68 @@ class SimulationOrchestratorParallel:
 
         return runner.summarize_results()
 
-    def run_all(self, max_workers: int | None = None):
-        """Run all scenarios with thread-based parallelism.
+    @staticmethod
+    def _run_scenario_chunk(scenarios: list[SimulationScenario]) -> list[dict]:
+        """Run a chunk of scenarios in one worker and return their results."""
+        return [
+            SimulationOrchestratorParallel._run_single_scenario(scenario)
+            for scenario in scenarios
+        ]
+
+    def run_all(
+        self,
+        max_workers: int | None = None,
+        use_threads: bool = False,
+        chunk_size: int = 64,
+    ):
+        """Run all scenarios in parallel.
+
+        By default scenarios are distributed over worker processes, which
+        sidesteps the GIL. Threads are only useful under a free-threaded
+        interpreter (python -X gil=0).
+
+        Scenarios are sent to workers in chunks: a single scenario takes only
+        milliseconds, so submitting them one by one would spend a large share
+        of the time on task dispatch and result transfer.
+
         Args:
-            max_workers (int | None, optional): number of threads to use in 
+            max_workers (int | None, optional): number of workers to use in
                 execution. Defaults to None.
+            use_threads (bool, optional): whether to use threads instead of
+                processes. Defaults to False.
+            chunk_size (int, optional): number of scenarios per submitted
+                task. Defaults to 64.
         """
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            # Submit all scenarios to the executor
+        if use_threads:
+            executor = ThreadPoolExecutor(max_workers=max_workers)
+        else:
+            executor = ProcessPoolExecutor(
+                max_workers=max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+
+        # One slot per scenario, filled in whatever order scenarios finish
+        self.summary_results = [None] * len(self.scenarios)
+
+        with executor:
+            # Submit scenarios in chunks, remembering where each chunk starts
             futures = {
-                executor.submit(self._run_single_scenario, scenario): scenario
-                for scenario in self.scenarios
+                executor.submit(
+                    self._run_scenario_chunk,
+                    self.scenarios[chunk_start : chunk_start + chunk_size],
+                ): chunk_start
+                for chunk_start in range(0, len(self.scenarios), chunk_size)
             }
 
             # Collect results as they complete, with a progress bar
-            for future in tqdm(
-                as_completed(futures), total=len(futures), desc="Running simulations"
-            ):
-                self.summary_results.append(future.result())
+            with tqdm(total=len(self.scenarios), desc="Running simulations") as pbar:
+                for future in as_completed(futures):
+                    chunk_results = future.result()
+                    chunk_start = futures[future]
+                    self.summary_results[
+                        chunk_start : chunk_start + len(chunk_results)
+                    ] = chunk_results
+                    pbar.update(len(chunk_results))
 
 
 class SimulationOrchestratorSequential:
@@ -72,7 +122,7 @@ class SimulationOrchestratorSequential:
             scenario: DGP and estimator type, associated parameters, number of
             simulations to run, sample size, first seed.
         summary_results (list): simulation results for each scenario, as
-            returned by corresponding simulation runner.
+            returned by corresponding simulation runner, in scenario order.
     """
 
     def __init__(self, scenarios: list[SimulationScenario]) -> None:
@@ -98,5 +148,8 @@ class SimulationOrchestratorSequential:
 
         The results are stored in the summary_results attribute.
         """
-        for scenario in tqdm(self.scenarios, desc="Running simulations"):
-            self.summary_results.append(self._run_single_scenario(scenario))
+        self.summary_results = [None] * len(self.scenarios)
+        for scenario_id, scenario in enumerate(
+            tqdm(self.scenarios, desc="Running simulations")
+        ):
+            self.summary_results[scenario_id] = self._run_single_scenario(scenario)
@@ -7,16 +7,19 @@ data-generating processes (DGPs) and tests.
 Protocols:
     DGPProtocol: Interface for data-generating processes.
     TestProtocol: Interface for test.
+    BatchDGPProtocol: Optional interface for DGPs that can draw many samples
+        at once.
+    BatchTestProtocol: Optional interface for tests that can be applied to
+        many samples at once.
 """
 
-from typing import Protocol
+from typing import Protocol, runtime_checkable
 
 import numpy as np
-import pandas as pd
 
 
 class TestProtocol(Protocol):
-    def test(self, x: pd.DataFrame, y: pd.DataFrame) -> None: ...
+    def test(self, x: np.ndarray, y: np.ndarray) -> None: ...
 
     @property
     def decision(self) -> np.bool: ...
@@ -27,11 +30,23 @@ class TestProtocol(Protocol):
 
 class DGPProtocol(Protocol):
     def sample(
-        self, n_obs: int, seed: int | None = None
-    ) -> tuple[pd.DataFrame, pd.DataFrame]: ...
+        self, n_obs: int, seed: int | np.random.Generator | None = None
+    ) -> tuple[np.ndarray, np.ndarray]: ...
 
     @property
     def covar_corr(self) -> float: ...
 
     @property
     def common_coef_val(self) -> float: ...
+
+
+@runtime_checkable
+class BatchDGPProtocol(Protocol):
+    def sample_many(
+        self, n_sim: int, n_obs: int, seed: int | None = None
+    ) -> tuple[np.ndarray, np.ndarray]: ...
+
+
+@runtime_checkable
+class BatchTestProtocol(Protocol):
+    def test_many(self, x: np.ndarray, y: np.ndarray) -> np.ndarray: ...
@@ -7,16 +7,31 @@ Classes:
 
 from pathlib import Path
 
-import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
 
 
+def _import_pyplot():
+    """Import pyplot with the non-interactive Agg backend.
+
+    Called by the export methods, so that matplotlib is only loaded when a
+    plot is actually exported. Plots are only saved as SVG files, so no GUI
+    backend is needed.
+    """
+    import matplotlib
+
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    return plt
+
+
 class ResultsProcessor:
     """Visualizes simulation results for comparing Wald vs. Bonferroni t test.
 
     Attributes:
-        input_path (Path): Path to the input CSV file containing simulation results.
+        input_path (Path): Path to the input Parquet file containing simulation
+            results.
         output_path (Path): Path to the directory where plots will be saved.
     """
 
@@ -45,10 +60,7 @@ class ResultsProcessor:
         The figure has two subplots, one for each test considered. Each subplot
         depicts the power surface as a function of the DGP parameters.
         """
-        # Create meshgrid
-        c_mesh, rho_mesh = np.meshgrid(
-            self.coef_val_range, self.corr_range, indexing="ij"
-        )
+        plt = _import_pyplot()
 
         # Create figure and add surface plots
         fig = plt.figure(figsize=(16, 6))
@@ -56,16 +68,16 @@ class ResultsProcessor:
 
         ax1 = fig.add_subplot(1, 2, 1, projection="3d")
         ax1.plot_surface(
-            c_mesh,
-            -rho_mesh,
+            self.c_mesh,
+            -self.rho_mesh,
             self.wald_results,
             edgecolor="peru",
             lw=0.5,
             alpha=0.3,
         )
         ax1.contour(
-            c_mesh,
-            rho_mesh,
+            self.c_mesh,
+            self.rho_mesh,
             self.wald_results,
             zdir="y",
             offset=-self.corr_range.min(),
@@ -74,16 +86,16 @@ class ResultsProcessor:
 
         ax2 = fig.add_subplot(1, 2, 2, projection="3d")
         ax2.plot_surface(
-            c_mesh,
-            -rho_mesh,
+            self.c_mesh,
+            -self.rho_mesh,
             self.bonf_results,
             edgecolor="peru",
             lw=0.5,
             alpha=0.34,
         )
         ax2.contour(
-            c_mesh,
-            rho_mesh,
+            self.c_mesh,
+            self.rho_mesh,
             self.bonf_results,
             zdir="y",
             offset=-self.corr_range.min(),
@@ -141,10 +153,7 @@ class ResultsProcessor:
         The figure shows the difference in power between the two tests 
         as a function of the DGP parameters.
         """
-        # Create meshgrid
-        c_mesh, rho_mesh = np.meshgrid(
-            self.coef_val_range, self.corr_range, indexing="ij"
-        )
+        plt = _import_pyplot()
 
         # Create figure and add surface plots
         fig = plt.figure(figsize=(11, 6))
@@ -152,17 +161,17 @@ class ResultsProcessor:
 
         ax = fig.add_subplot(1, 1, 1, projection="3d")
         ax.plot_surface(
-            c_mesh,
-            -rho_mesh,
-            self.wald_results - self.bonf_results,
+            self.c_mesh,
+            -self.rho_mesh,
+            self.power_diff,
             edgecolor="peru",
             lw=0.5,
             alpha=0.3,
         )
         ax.contour(
-            c_mesh,
-            rho_mesh,
-            self.wald_results - self.bonf_results,
+            self.c_mesh,
+            self.rho_mesh,
+            self.power_diff,
             zdir="y",
             offset=-self.corr_range.min(),
             cmap="coolwarm",
@@ -199,22 +208,53 @@ class ResultsProcessor:
         Args:
             input_path (Path): path to table with simulation results
         """
-        sim_results = pd.read_csv(input_path)
+        sim_results = pd.read_parquet(input_path)
 
         # Extract ranges of DGP parameters used
-        self.coef_val_range = sim_results["common_coef_val"].unique()
-        self.corr_range = sim_results["rho"].unique()
+        self.coef_val_range = np.sort(sim_results["common_coef_val"].unique())
+        self.corr_range = np.sort(sim_results["rho"].unique())
 
         # Process and reshape power arrays
-        self.wald_results = (
-            sim_results.loc[sim_results.loc[:, "test"] == "Wald"]
-            .groupby(["common_coef_val", "rho"])["power"]
-            .mean()
-            .unstack()
+        power_grids = self._power_grids(sim_results)
+        self.wald_results = power_grids["Wald"]
+        self.bonf_results = power_grids["Bonferroni t"]
+        self.power_diff = self.wald_results - self.bonf_results
+
+        # Create meshgrid, shared by all plots
+        self.c_mesh, self.rho_mesh = np.meshgrid(
+            self.coef_val_range, self.corr_range, indexing="ij"
         )
-        self.bonf_results = (
-            sim_results.loc[sim_results.loc[:, "test"] == "Bonferroni t"]
-            .groupby(["common_coef_val", "rho"])["power"]
-            .mean()
-            .unstack()
+
+    def _power_grids(self, sim_results: pd.DataFrame) -> dict[str, np.ndarray]:
+        """Arrange the power of each test on the grid of DGP parameters.
+
+        The grid is regular, so each result is placed directly at the position
+        of its test and parameter values. All tests are handled in a single
+        pass over the table. Repeated cells are averaged.
+
+        Args:
+            sim_results (pd.DataFrame): table with simulation results.
+
+        Returns:
+            dict: power indexed by (coefficient value, correlation), by test name.
+        """
+        # Locate each result on the (test, coefficient, correlation) grid
+        test_codes, test_names = pd.factorize(sim_results["test"])
+        grid_idx = (
+            test_codes,
+            np.searchsorted(
+                self.coef_val_range, sim_results["common_coef_val"].to_numpy()
+            ),
+            np.searchsorted(self.corr_range, sim_results["rho"].to_numpy()),
         )
+        grid_shape = (len(test_names), self.coef_val_range.size, self.corr_range.size)
+
+        # Average power within each cell
+        power_sum = np.zeros(grid_shape)
+        np.add.at(power_sum, grid_idx, sim_results["power"].to_numpy())
+        counts = np.zeros(grid_shape)
+        np.add.at(counts, grid_idx, 1)
+        with np.errstate(invalid="ignore"):
+            power = power_sum / counts
+
+        return dict(zip(test_names, power))
@@ -11,7 +11,12 @@ Classes:
 
 import numpy as np
 
-from sim_infrastructure.protocols import DGPProtocol, TestProtocol
+from sim_infrastructure.protocols import (
+    BatchDGPProtocol,
+    BatchTestProtocol,
+    DGPProtocol,
+    TestProtocol,
+)
 
 
 class SimulationRunner:
@@ -44,18 +49,27 @@ class SimulationRunner:
             first_seed (int | None): starting random seed for reproducibility.
                 Defaults to None.
         """
+        if isinstance(self.dgp, BatchDGPProtocol):
+            # Draw all datasets at once from a single generator
+            x_all, y_all = self.dgp.sample_many(n_sim, n_obs, seed=first_seed)
+            # Fast path: test them in one vectorized pass if possible
+            if isinstance(self.test, BatchTestProtocol):
+                self.test_decisions = self.test.test_many(x_all, y_all)
+                return
+            datasets = zip(x_all, y_all)
+        else:
+            # Draw datasets one by one, all from one generator seeded once
+            rng = np.random.default_rng(first_seed)
+            datasets = (self.dgp.sample(n_obs, seed=rng) for _ in range(n_sim))
+
         # Preallocate array to hold test decisions
-        self.test_decisions = np.empty(n_sim)
+        self.test_decisions = np.empty(n_sim, dtype=np.bool_)
 
         # Run simulation
-        for sim_id in range(n_sim):
-            # Draw data
-            x, y = self.dgp.sample(
-                n_obs, seed=first_seed + sim_id if first_seed else None
-            )
+        for sim_id, (x, y) in enumerate(datasets):
             # Test null of zero coefficients
             self.test.test(x, y)
-            # Store error
+            # Store decision
             self.test_decisions[sim_id] = self.test.decision
 
     def summarize_results(self) -> dict:
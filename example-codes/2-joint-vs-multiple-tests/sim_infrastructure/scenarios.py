@@ -25,7 +25,7 @@ from tests.joint import WaldWithOLS
 from tests.multiple import BonferronigMultipleTWithOLS
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SimulationScenario:
     """A single simulation scenario: DGP, test, and sample size."""
 
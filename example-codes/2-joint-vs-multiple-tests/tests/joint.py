@@ -5,9 +5,18 @@ Classes:
     WaldWithOLS: OLS-based Wald test that all non-intercept coefficients are zero.
 """
 
+from functools import lru_cache
+
 import numpy as np
-import pandas as pd
-from statsmodels.regression.linear_model import OLS
+from scipy.stats import chi2
+
+from tests.ols import fit_ols
+
+
+@lru_cache(maxsize=8)
+def _wald_critical_value(num_restrictions: int) -> float:
+    """Critical value of the 5% chi-squared Wald test with given restrictions."""
+    return chi2.isf(0.05, df=num_restrictions)
 
 
 class WaldWithOLS:
@@ -28,27 +37,36 @@ class WaldWithOLS:
         self.name: str = "Wald"
         self.decision: np.bool
 
-    def test(self, x: pd.DataFrame, y: pd.DataFrame) -> None:
+    def test(self, x: np.ndarray, y: np.ndarray) -> None:
         """Carry out the Wald test with given data.
 
         Args:
-            x (pd.DataFrame): covariates, including a leading constant column.
-            y (pd.DataFrame): outcomes.
+            x (np.ndarray): covariates, including a leading constant column.
+            y (np.ndarray): outcomes.
         """
-        # Fit models
-        lin_reg = OLS(y, x)
-        lin_reg_fit = lin_reg.fit()
+        # Same computation as for a batch, applied to a batch of one
+        self.decision = self.test_many(x[None], y[None])[0]
 
-        # Perform Wald test
-        num_covars = x.shape[1]
-        wald_restriction_matrix = np.concatenate(
-            (np.zeros((num_covars - 1, 1)), np.eye(num_covars - 1)), axis=1
-        )
+    def test_many(self, x: np.ndarray, y: np.ndarray) -> np.ndarray:
+        """Carry out the Wald test on a batch of datasets at once.
+
+        Args:
+            x (np.ndarray): covariates, including a leading constant column,
+                shape (n_sim, n_obs, k).
+            y (np.ndarray): outcomes, shape (n_sim, n_obs).
+
+        Returns:
+            np.ndarray: whether null is rejected in each dataset, shape (n_sim,).
+        """
+        # Fit models
+        beta, covar = fit_ols(x, y)
 
-        wald_test = lin_reg_fit.wald_test(
-            wald_restriction_matrix,
-            use_f=False,
-            scalar=True,
+        # Wald statistic for the non-intercept coefficients
+        beta_slopes = beta[:, 1:]
+        wald_stats = np.einsum(
+            "si,si->s",
+            beta_slopes,
+            np.linalg.solve(covar[:, 1:, 1:], beta_slopes[..., None])[..., 0],
         )
 
-        self.decision = wald_test.pvalue <= 0.05
+        return wald_stats >= _wald_critical_value(x.shape[2] - 1)
@@ -6,10 +6,18 @@ Classes:
         coefficients are zero. Uses Bonferroni correction.
 """
 
+from functools import lru_cache
+
 import numpy as np
-import pandas as pd
-from statsmodels.regression.linear_model import OLS
-from statsmodels.stats.multitest import multipletests
+from scipy.stats import t
+
+from tests.ols import fit_ols
+
+
+@lru_cache(maxsize=8)
+def _bonferroni_critical_value(num_tests: int, df: int) -> float:
+    """Critical |t| value of the 5% two-sided Bonferroni multiple t-test."""
+    return t.isf(0.05 / (2 * num_tests), df=df)
 
 
 class BonferronigMultipleTWithOLS:
@@ -30,21 +38,36 @@ class BonferronigMultipleTWithOLS:
         self.name: str = "Bonferroni t"
         self.decision: np.bool
 
-    def test(self, x: pd.DataFrame, y: pd.DataFrame) -> None:
+    def test(self, x: np.ndarray, y: np.ndarray) -> None:
         """Carry out the multiple t-test with given data.
 
         Args:
-            x (pd.DataFrame): covariates, including a leading constant column.
-            y (pd.DataFrame): outcomes.
+            x (np.ndarray): covariates, including a leading constant column.
+            y (np.ndarray): outcomes.
+        """
+        # Same computation as for a batch, applied to a batch of one
+        self.decision = self.test_many(x[None], y[None])[0]
+
+    def test_many(self, x: np.ndarray, y: np.ndarray) -> np.ndarray:
+        """Carry out the multiple t-test on a batch of datasets at once.
+
+        Args:
+            x (np.ndarray): covariates, including a leading constant column,
+                shape (n_sim, n_obs, k).
+            y (np.ndarray): outcomes, shape (n_sim, n_obs).
+
+        Returns:
+            np.ndarray: whether null is rejected in each dataset, shape (n_sim,).
         """
         # Fit models
-        lin_reg = OLS(y, x)
-        lin_reg_fit = lin_reg.fit()
-
-        # Perform multiple t-tests
-        p_vals_t = lin_reg_fit.pvalues.iloc[1:]
-        t_test_corrected_bonf = multipletests(
-            p_vals_t,
-            method="bonferroni", 
-        )
-        self.decision = t_test_corrected_bonf[0].sum() > 0
+        n_obs, num_covars = x.shape[1:]
+        beta, covar = fit_ols(x, y)
+
+        # Two-sided t-tests of the non-intercept coefficients
+        std_errors = np.sqrt(np.diagonal(covar, axis1=1, axis2=2)[:, 1:])
+        t_stats = np.abs(beta[:, 1:] / std_errors)
+
+        # Bonferroni correction: p-value below alpha/m is the same as |t| above
+        # the corresponding quantile. Reject if this holds for any coefficient
+        crit_val = _bonferroni_critical_value(num_covars - 1, n_obs - num_covars)
+        return (t_stats >= crit_val).any(axis=1)
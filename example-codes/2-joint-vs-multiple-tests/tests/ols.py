@@ -0,0 +1,37 @@
+"""
+Module for OLS computations shared by the tests.
+
+Functions:
+    fit_ols: OLS coefficients and their covariance for one or many datasets.
+"""
+
+import numpy as np
+
+
+def fit_ols(x: np.ndarray, y: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Fit OLS of y on x, vectorized over any leading axes.
+
+    Matches the defaults of statsmodels' OLS: the covariance is the classical
+    (homoskedastic) one, with a degrees-of-freedom corrected error variance.
+
+    Args:
+        x (np.ndarray): covariates, shape (..., n_obs, k).
+        y (np.ndarray): outcomes, shape (..., n_obs).
+
+    Returns:
+        tuple: (beta, covar) arrays of shapes (..., k) and (..., k, k).
+    """
+    n_obs, n_covars = x.shape[-2:]
+    x_t = np.swapaxes(x, -1, -2)
+
+    # Solve the normal equations. Products are written with matmul, which
+    # dispatches to BLAS over the stack of datasets
+    gram_inv = np.linalg.inv(x_t @ x)
+    beta = (gram_inv @ (x_t @ y[..., None]))[..., 0]
+
+    # Estimate error variance and covariance of beta
+    resids = y - (x @ beta[..., None])[..., 0]
+    sigma2 = np.einsum("...n,...n->...", resids, resids) / (n_obs - n_covars)
+    covar = sigma2[..., None, None] * gram_inv
+
+    return beta, covar
@@ -7,55 +7,110 @@ This module contains the following core functions:
     - asymptotic_ci_variance(): construct an asymptotic confidence interval for
         the variance of the normal distribution based on the limit distribution
         of the maximum likelihood estimator for variance.
+    - asymptotic_ci_from_estimate(): construct the same interval from an
+        already computed variance estimate.
     - run_simulations(): run Monte Carlo simulations for coverage and interval
         length of confidence intervals for the variance of the normal
         distribution based on the maximum likelihood estimator.
+
+Classes:
+    SimulationResults: data class with results of run_simulations().
 """
 
+from dataclasses import dataclass
+from functools import lru_cache
+
 import numpy as np
 
-from scipy.stats import norm
+from scipy.stats import chi2, norm
+
+
+@dataclass(frozen=True)
+class SimulationResults:
+    """Results of run_simulations(), one array per statistic.
+
+    Arrays are indexed by sample size first and true variance second, in the
+    order of n_obs_list and true_vars. The last axis of errors and lengths
+    runs over Monte Carlo draws.
+    """
+
+    true_vars: np.ndarray  # Shape (V,)
+    n_obs_list: np.ndarray  # Shape (N,)
+    coverage: np.ndarray  # Shape (N, V), averaged across draws
+    errors: np.ndarray  # Shape (N, V, n_simulations)
+    lengths: np.ndarray  # Shape (N, V, n_simulations), normalized by variance
+
 
+@lru_cache(maxsize=8)
+def _z_crit(alpha: float) -> float:
+    """Normal critical value of a two-sided 1-alpha interval, computed once."""
+    return float(norm.ppf(1 - alpha / 2))
 
-def mle_variance(data: np.ndarray) -> np.floating:
+
+def mle_variance(data: np.ndarray) -> np.floating | np.ndarray:
     """Estimate the variance of a normal distribution using maximum likelihood.
 
     Args:
-        data (np.ndarray): 1D array with samples.
+        data (np.ndarray): array with samples along the last axis. A 2D array
+            holds one sample per row.
 
     Returns:
-        np.floating: maximum likelihood estimator for variance of the normal
-            distribution.
+        np.floating | np.ndarray: maximum likelihood estimator for variance of
+            the normal distribution, one for each sample.
     """
-    # MLE for variance is the sample variance with ddof=0
-    return np.var(data, ddof=0)
+    # MLE for variance is the sample variance with ddof=0. Written as a
+    # two-pass sum of squares, which needs fewer temporaries than np.var
+    data_demeaned = data - data.mean(axis=-1, keepdims=True)
+    return np.einsum("...n,...n->...", data_demeaned, data_demeaned) / data.shape[-1]
 
 
 def asymptotic_ci_variance(
     data: np.ndarray, alpha: float = 0.05
-) -> tuple[float, float]:
+) -> tuple[float | np.ndarray, float | np.ndarray]:
     """Construct an asymptotic (Wald-type) confidence interval for the variance.
 
     Lower bound of the confidence interval truncated to zero if necessary.
 
     Args:
-        data (np.ndarray): 1D array with samples.
+        data (np.ndarray): array with samples along the last axis. A 2D array
+            holds one sample per row.
         alpha (float, optional): 1-alpha is the desired nominal coverage.
             Defaults to 0.05 (fir 95% nominal intervals.)
 
     Returns:
-        tuple[float, float]: lower and upper limits of the confidence interval.
+        tuple: lower and upper limits of the confidence interval, one for each
+            sample.
     """
-    n_obs = len(data)
+    # Run maximum likelihood and construct intervals
+    return asymptotic_ci_from_estimate(mle_variance(data), data.shape[-1], alpha)
+
 
-    # Run maximum likelihood
-    variance_est = mle_variance(data)
-    variance_std_error = np.sqrt(2 * variance_est**2 / n_obs)
+def asymptotic_ci_from_estimate(
+    variance_est: float | np.ndarray, n_obs: int, alpha: float = 0.05
+) -> tuple[float | np.ndarray, float | np.ndarray]:
+    """Construct the asymptotic confidence interval from a variance estimate.
+
+    Same interval as asymptotic_ci_variance(), for when the maximum likelihood
+    estimate is already available.
+
+    Args:
+        variance_est (float | np.ndarray): maximum likelihood estimates of
+            the variance.
+        n_obs (int): sample size behind each estimate.
+        alpha (float, optional): 1-alpha is the desired nominal coverage.
+            Defaults to 0.05 (fir 95% nominal intervals.)
+
+    Returns:
+        tuple: lower and upper limits of the confidence interval, one for each
+            estimate.
+    """
+    # The standard error sqrt(2 * variance_est**2 / n_obs) is a fixed multiple
+    # of the (non-negative) estimate, so the half-width is a single product
+    half_width = (_z_crit(alpha) * np.sqrt(2 / n_obs)) * variance_est
 
     # Construct intervals, ensuring non-negative lower bound
-    z_crit = norm.ppf(1 - alpha / 2)
-    lower = max(0, variance_est - z_crit * variance_std_error)
-    upper = variance_est + z_crit * variance_std_error
+    lower = np.maximum(0, variance_est - half_width)
+    upper = variance_est + half_width
     return lower, upper
 
 
@@ -65,12 +120,26 @@ def run_simulations(
     n_obs_list: list[int] = [20, 100],
     alpha: float = 0.05,
     seed: int = 1,
-) -> dict[int, dict[float, dict]]:
+    stratified: bool = False,
+) -> SimulationResults:
     """
     Simulate confindence intervals properties for given variances and sample sizes.
 
     Runs a separate simulation round for each combination of (true_variance,
     n_obs), sampling n_obs points from a N(0, true_variance) distribution.
+    For a given n_obs, samples for all true variances are the same standard
+    normal draws scaled by the true standard deviation. Coverage and
+    normalized lengths are then the same for all true variances, and are
+    computed once. Each sample size draws from its own independent stream,
+    spawned from the seed, so its draws do not depend on the other sample
+    sizes simulated.
+
+    Optionally, the samples themselves are not simulated. Instead, the
+    normalized estimate n_obs * var_hat / true_var, which follows a
+    chi-squared distribution with n_obs - 1 degrees of freedom, is drawn by
+    stratified inverse-CDF sampling: one uniform draw in each of
+    n_simulations equal strata of [0, 1). This leaves the estimates
+    unbiased and lowers their Monte Carlo error considerably.
 
     For each scenario the simulation computes:
         - Coverage;
@@ -86,40 +155,52 @@ def run_simulations(
         alpha (float, optional): 1-alpha is the desired nominal coverage.
             Defaults to 0.05 (fir 95% nominal intervals.)
         seed (int): Random seed for reproducibility. Defaults to 1.
+        stratified (bool, optional): whether to draw variance estimates by
+            stratified sampling from their exact distribution instead of
+            simulating samples. Defaults to False.
 
     Returns:
-        Nested dictionary: {n_obs: {true_var: {'coverage': ..., 'errors': ...,
-            'lengths': ...}}}. Coverages are reported as a single float, averaged
-            across Monte Carlo draws. Estimation errors and confidence interval
-            lengths are arrays.
+        SimulationResults: coverages, averaged across Monte Carlo draws, and
+            arrays of all estimation errors and confidence interval lengths.
+            Lengths of a sample size are shared by all its true variances:
+            they are a read-only broadcast view, not a copy per variance.
     """
-    rng = np.random.default_rng(seed)
-    results = {n_obs: {} for n_obs in n_obs_list}
+    true_vars = np.asarray(true_vars)
+    n_obs_list = np.asarray(n_obs_list)
+
+    # One independent random stream per sample size
+    seed_seqs = np.random.SeedSequence(seed).spawn(n_obs_list.size)
+
+    # Allocate results, one row per sample size
+    coverage = np.empty((n_obs_list.size, true_vars.size))
+    errors = np.empty((n_obs_list.size, true_vars.size, n_simulations))
+    lengths = np.empty((n_obs_list.size, n_simulations))
 
     # Loop over sample sizes
-    for n_obs in n_obs_list:
-        # Loop over true variance values
-        for true_var in true_vars:
-            errors = []
-            lengths = []
-            coverage = []
-            for _ in range(n_simulations):
-                # Draw data and run estimation
-                data = rng.normal(0, np.sqrt(true_var), n_obs)
-                var_hat = mle_variance(data)
-
-                # Record estimation error in variance
-                errors.append(var_hat - true_var)
-
-                # Construct CI and check if variance belongs to it
-                ci_lower, ci_upper = asymptotic_ci_variance(data, alpha)
-                lengths.append((ci_upper - ci_lower) / true_var)
-                coverage.append(ci_lower <= true_var <= ci_upper)
-
-            results[n_obs][true_var] = {
-                "coverage": np.mean(coverage),
-                "errors": np.array(errors),
-                "lengths": np.array(lengths),
-            }
-
-    return results
+    for n_obs_id, (n_obs, seed_seq) in enumerate(zip(n_obs_list, seed_seqs)):
+        rng = np.random.default_rng(seed_seq)
+
+        # Draw all Monte Carlo samples at once, one per row. Scaling a sample
+        # by sqrt(true_var) scales its MLE and both interval limits by
+        # true_var, so everything is computed once on standard normal draws
+        if stratified:
+            strata = np.arange(n_simulations) + rng.random(n_simulations)
+            std_var_hat = chi2.ppf(strata / n_simulations, n_obs - 1) / n_obs
+        else:
+            std_var_hat = mle_variance(rng.standard_normal((n_simulations, n_obs)))
+        std_lower, std_upper = asymptotic_ci_from_estimate(std_var_hat, n_obs, alpha)
+
+        # Coverage and normalized lengths do not depend on the true variance
+        coverage[n_obs_id] = np.mean((std_lower <= 1) & (1 <= std_upper))
+        lengths[n_obs_id] = std_upper - std_lower
+
+        # Errors scale with the true variance: one row per true variance
+        errors[n_obs_id] = np.multiply.outer(true_vars, std_var_hat - 1)
+
+    return SimulationResults(
+        true_vars=true_vars,
+        n_obs_list=n_obs_list,
+        coverage=coverage,
+        errors=errors,
+        lengths=np.broadcast_to(lengths[:, None, :], errors.shape),
+    )
@@ -13,40 +13,40 @@ from pathlib import Path
 
 import matplotlib.pyplot as plt
 import numpy as np
-import seaborn as sns
+from scipy.signal import fftconvolve
 from scipy.stats import norm
 
+from sim_infrastructure.core import SimulationResults
+
 # Set constants for plotting here
 BG_COLOR = "whitesmoke"
 
 
-def plot_coverage_and_lengths(
-    results: dict[int, dict[float, dict]], output_dir: Path
-) -> None:
+def plot_coverage_and_lengths(results: SimulationResults, output_dir: Path) -> None:
     """Plots coverage and normalized interval lengths as a function of the
        true variance.
 
     The same figure is used for all sample sizes in the results.
 
-    The expected results dictionary is compatible with the format returned by
-    the sim_infrastructure.core.run_simulations() function.
-
     Args:
-        results (dict[int, dict[float, dict]]): dictionary indexed as
-            {n_obs: {true_var: {"coverage":..., "length":...}}}.
+        results (SimulationResults): results as returned by the
+            sim_infrastructure.core.run_simulations() function.
         output_dir (Path): where to store the resultin gfigures.
     """
     # Make sure output folder exists
     Path(output_dir).mkdir(parents=True, exist_ok=True)
 
     # Extract the true variancs
-    true_vars = list(next(iter(results.values())).keys())
+    true_vars = results.true_vars
+
+    # Average lengths for all sample sizes and variances in one reduction,
+    # shape (N, V)
+    mean_lengths = results.lengths.mean(axis=-1)
 
     # Coverage plot
     fig, ax = plt.subplots(figsize=(14, 6))
     fig.patch.set_facecolor(BG_COLOR)
-    for n_obs, res in results.items():
-        coverages = [res[var]["coverage"] for var in true_vars]
+    for n_obs, coverages in zip(results.n_obs_list, results.coverage):
         ax.plot(true_vars, coverages, "o-", label=f"{n_obs} observations")
     ax.axhline(0.95, color="gray", linestyle="--", label="Nominal 95%")
 
@@ -68,8 +68,7 @@ def plot_coverage_and_lengths(
     # Length plot
     fig, ax = plt.subplots(figsize=(14, 6))
     fig.patch.set_facecolor(BG_COLOR)
-    for n_obs, res in results.items():
-        lengths = [np.mean(res[var]["lengths"]) for var in true_vars]
+    for n_obs, lengths in zip(results.n_obs_list, mean_lengths):
         ax.plot(true_vars, lengths, "o-", label=f"{n_obs} observations")
     ax.set_xlim(true_vars[0], true_vars[-1])
     ax.set_xscale("log")
@@ -82,50 +81,98 @@ def plot_coverage_and_lengths(
     plt.close()
 
 
-def plot_error_kdes(results: dict[int, dict[float, dict]], output_dir: Path) -> None:
-    """Plot density of estimation errors for each true variance and sample size.
+def _binned_kde(
+    data: np.ndarray, grid_size: int = 1024, cut: float = 3
+) -> tuple[np.ndarray, np.ndarray]:
+    """Gaussian kernel density estimate of data, evaluated on a regular grid.
+
+    Uses Scott's rule for the bandwidth and extends the grid by cut bandwidths
+    beyond the data, as seaborn.kdeplot() does. Data are first linearly binned
+    onto the grid, and the bin weights are then convolved with the kernel
+    using the FFT. This costs O(n + grid_size log grid_size) instead of
+    evaluating every kernel at every grid point.
+
+    Args:
+        data (np.ndarray): 1D array of observations.
+        grid_size (int, optional): number of grid points. Defaults to 1024.
+        cut (float, optional): grid extends this many bandwidths beyond the
+            smallest and largest observations. Defaults to 3.
+
+    Returns:
+        tuple: grid points and estimated density at them.
+    """
+    # Scott's rule and evaluation grid
+    bandwidth = data.std(ddof=1) * data.size ** (-1 / 5)
+    grid = np.linspace(
+        data.min() - cut * bandwidth, data.max() + cut * bandwidth, grid_size
+    )
+    step = grid[1] - grid[0]
+
+    # Linear binning: split each observation between its two nearest points
+    position = (data - grid[0]) / step
+    left = np.minimum(position.astype(np.intp), grid_size - 2)
+    weight_right = position - left
+    bin_weights = np.bincount(left, weights=1 - weight_right, minlength=grid_size)
+    bin_weights += np.bincount(left + 1, weights=weight_right, minlength=grid_size)
 
-    A separate figure is exported for each true variance and sample size.
+    # Convolve with the kernel, truncated where it is numerically zero
+    half_width = min(grid_size - 1, int(np.ceil(5 * bandwidth / step)))
+    kernel = norm.pdf(np.arange(-half_width, half_width + 1) * step, 0, bandwidth)
+    density = fftconvolve(bin_weights, kernel, mode="same") / data.size
+    return grid, np.maximum(density, 0)
 
-    The expected results dictionary is compatible with the format returned by
-    the sim_infrastructure.core.run_simulations() function.
+
+def plot_error_kdes(results: SimulationResults, output_dir: Path) -> None:
+    """Plot density of estimation errors for each true variance and sample size.
+
+    A separate figure is exported for each true variance and sample size. The
+    figures only differ in their data and title, so a single figure and its
+    artists are created once and updated for every export.
 
     Args:
-        results (dict[int, dict[float, dict]]): dictionary indexed as
-            {n_obs: {true_var: {"coverage":..., "length":...}}}.
+        results (SimulationResults): results as returned by the
+            sim_infrastructure.core.run_simulations() function.
         output_dir (Path): where to store the resultin gfigures.
     """
     # Make sure output folder exists
     Path(output_dir).mkdir(parents=True, exist_ok=True)
 
-    # Plot separately for each true_var, n_obs
-    for n_obs, res in results.items():
-        for true_var, data in res.items():
-            # Create figure
-            fig, ax = plt.subplots(figsize=(14, 6))
-            fig.patch.set_facecolor(BG_COLOR)
+    # Create figure, with empty lines for the density of estimation errors
+    # and for the limit (normal distribution with matching variances)
+    fig, ax = plt.subplots(figsize=(14, 6))
+    fig.patch.set_facecolor(BG_COLOR)
+    (kde_line,) = ax.plot([], [], alpha=0.5, label="MC Errors")
+    (limit_line,) = ax.plot([], [], "r-", lw=2, label="Asymptotic Normal")
 
+    # Make plot nicer
+    ax.set_xlabel("MLE - True Variance")
+    ax.set_ylabel("Density")
+    ax.legend()
+    ax.grid(True)
+
+    # Plot separately for each true_var, n_obs
+    for n_obs, errors_n_obs in zip(results.n_obs_list, results.errors):
+        for true_var, errors in zip(results.true_vars, errors_n_obs):
             # Add density of estimation errors
-            sns.kdeplot(data["errors"], ax=ax, alpha=0.5, label="MC Errors")
+            kde_line.set_data(*_binned_kde(errors))
+
+            # Add limit
+            error_std = np.sqrt(2 * true_var**2 / n_obs)
+            x = np.linspace(errors.min(), errors.max(), 1000)
+            limit_line.set_data(x, norm.pdf(x, 0, error_std))
 
-            # Add limit (normal distribution with matching variances)
-            error_std = np.sqrt(2 * true_var**2 / n_obs)  
-            x = np.linspace(min(data["errors"]), max(data["errors"]), 1000)
-            ax.plot(x, norm.pdf(x, 0, error_std), "r-", lw=2, label="Asymptotic Normal")
+            # Rescale axes to the new data
+            ax.relim()
+            ax.autoscale_view()
 
-            # Make plot nicer
             ax.set_title(
                 f"Estimation Errors ({n_obs} Observations, True Var={true_var:.4f})",
                 weight="bold",
                 loc="left",
             )
-            ax.set_xlabel("MLE - True Variance")
-            ax.set_ylabel("Density")
-            ax.legend()
-            ax.grid(True)
             fig.savefig(
                 f"{output_dir}/errors_n{n_obs}_var_{true_var:.4f}.svg",
                 dpi=200,
                 bbox_inches="tight",
             )
-            plt.close()
+    plt.close(fig)
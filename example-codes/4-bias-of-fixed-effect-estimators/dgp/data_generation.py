@@ -3,6 +3,8 @@ Functions for data generation for FE model.
 
 Functions:
     - generate_data(): generates (Y, X) panel data follow DGP in the lecture.
+    - generate_panel_arrays(): generates the same panel as a dictionary of
+        column arrays, without building a DataFrame.
 """
 
 import numpy as np
@@ -13,7 +15,7 @@ def generate_data(
     num_units: int,
     beta_mean: float,
     params: dict[str, np.ndarray | np.floating],
-    seed: int | None = None,
+    seed: int | np.random.SeedSequence | None = None,
 ) -> pd.DataFrame:
     """
     Generates an `num_units x 2` panel dataset with two types of slopes:
@@ -27,11 +29,42 @@ def generate_data(
             - "mu_minus" (np.ndarray): Mean for covariates when effect is -1.
             - "sigma_plus" (np.ndarray): Covariance for X when effect is +1.
             - "sigma_minus" (np.ndarray): Covariance for X when effect is -1.
-        seed (int, optional): Random seed for reproducibility.
+        seed (int | np.random.SeedSequence, optional): Random seed for
+            reproducibility.
 
     Returns:
         pd.DataFrame: Generated dataset.
     """
+    return pd.DataFrame(generate_panel_arrays(num_units, beta_mean, params, seed))
+
+
+def generate_panel_arrays(
+    num_units: int,
+    beta_mean: float,
+    params: dict[str, np.ndarray | np.floating],
+    seed: int | np.random.SeedSequence | None = None,
+) -> dict[str, np.ndarray]:
+    """
+    Generates the panel of generate_data() as column arrays.
+
+    Rows are sorted by unit, then period. Units are numbered consecutively
+    from zero.
+
+    Args:
+        num_units (int): Total number of units.
+        beta_mean (float): Average coefficient for the covariates.
+        params (Dict[str, np.ndarray]): Dictionary containing:
+            - "mu_plus" (np.ndarray): Mean for covariates when effect is +1.
+            - "mu_minus" (np.ndarray): Mean for covariates when effect is -1.
+            - "sigma_plus" (np.ndarray): Covariance for X when effect is +1.
+            - "sigma_minus" (np.ndarray): Covariance for X when effect is -1.
+        seed (int | np.random.SeedSequence, optional): Random seed for
+            reproducibility.
+
+    Returns:
+        dict[str, np.ndarray]: Columns "Unit", "Period", "outcome",
+            "covariate", and "effects" of the generated dataset.
+    """
 
     # Initialize RNG
     rng = np.random.default_rng(seed)
@@ -40,46 +73,57 @@ def generate_data(
     ind_effects = rng.choice([-1, 1], size=num_units)
 
     # Helper function to generate data for a given effect type
-    def generate_for_effect(effect, mu_x, sigma_x, sigma_u, beta):
+    def generate_for_effect(effect, mu_x, chol_sigma_x, sigma_u, beta):
         # Select units with the specified effect
         num_units_effect = np.sum(ind_effects == effect)
 
         # Generate covariates and shocks
-        covariates = rng.multivariate_normal(mu_x, sigma_x, size=num_units_effect)
+        covariates = (
+            rng.standard_normal((num_units_effect, 2)) @ chol_sigma_x.T + mu_x
+        )
         shocks = rng.normal(loc=0, scale=sigma_u, size=(num_units_effect, 2))
 
         # Generate outcomes
         outcomes = effect + beta * covariates + shocks
 
-        # Create a DataFrame
-        data = pd.DataFrame(
-            {
-                "outcome": pd.DataFrame(outcomes).stack(),
-                "covariate": pd.DataFrame(covariates).stack(),
-                "effects": pd.DataFrame(ind_effects).stack()
-            }
-        )
-        data.index = data.index.rename(["Unit", "Period"])
-        return data.reset_index()
+        # Arrange in long form: one row per (unit, period), with the two
+        # columns of outcomes and covariates as the two periods
+        num_periods = outcomes.shape[1]
+        return {
+            "Unit": np.repeat(np.arange(num_units_effect), num_periods),
+            "Period": np.tile(np.arange(num_periods), num_units_effect),
+            "outcome": outcomes.ravel(),
+            "covariate": covariates.ravel(),
+            "effects": np.full(num_units_effect * num_periods, effect),
+        }
+
+    # Factor covariances of covariates once: X = mu + L Z with Z standard
+    # normal is cheaper than multivariate_normal(), which runs an SVD of the
+    # covariance on every call
+    chol_sigma_plus = np.linalg.cholesky(params["sigma_plus"])
+    chol_sigma_minus = np.linalg.cholesky(params["sigma_minus"])
 
     # Generate data for +1 and -1 effects
     data_plus = generate_for_effect(
         1,
         params["mu_plus"],
-        params["sigma_plus"],
+        chol_sigma_plus,
         1,
         beta_mean + 1,
     )
     data_minus = generate_for_effect(
         1,
         params["mu_minus"],
-        params["sigma_minus"],
+        chol_sigma_minus,
         1,
         beta_mean - 1,
     )
 
     # Adjust unit indices for negative effect data
-    data_minus["Unit"] += len(data_plus["Unit"].unique())
+    data_minus["Unit"] += data_plus["Unit"].max(initial=-1) + 1
 
-    # Combine datasets and reset index
-    return pd.concat([data_plus, data_minus], axis=0).reset_index(drop=True)
+    # Combine datasets
+    return {
+        column: np.concatenate([data_plus[column], data_minus[column]])
+        for column in data_plus
+    }
@@ -15,6 +15,8 @@ The components of this file correspond to the attributes of the GMMSolver class.
 Functions:
 - sim_moment_conditions(params: np.ndarray) -> np.ndarray:
     Defines the moment equations evaluated at given parameters.
+- sim_moment_jacobian(params: np.ndarray) -> np.ndarray:
+    Jacobian of the moment equations with respect to the parameters.
 - process_mu_sigma_params(params: np.ndarray) -> dict:
     Extracts mu and sigma matrices from the parameter vector.
 
@@ -36,26 +38,71 @@ def sim_moment_conditions(params: np.ndarray) -> np.ndarray:
     Returns:
         np.ndarray: Moment equations evaluated at given parameters.
     """
-    sigma1p, sigma2p, rhop, mu1p, mu2p, sigma1m, sigma2m, rhom, mu1m, mu2m = params
+    # Unpack as Python floats: scalar arithmetic on them is much cheaper than
+    # on NumPy scalars, and gives the same IEEE double results
+    sigma1p, sigma2p, rhop, mu1p, mu2p, sigma1m, sigma2m, rhom, mu1m, mu2m = (
+        np.asarray(params).tolist()
+    )
+
+    # Squares shared by several moments, computed once. The moments keep the
+    # original order of operations, so the solution found by the optimizer
+    # does not change
+    sigma1p_sq, sigma2p_sq, mu1p_sq, mu2p_sq = sigma1p**2, sigma2p**2, mu1p**2, mu2p**2
+    sigma1m_sq, sigma2m_sq, mu1m_sq, mu2m_sq = sigma1m**2, sigma2m**2, mu1m**2, mu2m**2
+
+    moments = np.empty(3)
+    moments[0] = sigma2p_sq + mu2p_sq + mu2p - sigma2m_sq - mu2m_sq - mu2m
+    moments[1] = sigma1p_sq + mu1p_sq + mu1p - sigma1m_sq - mu1m_sq - mu1m
+    moments[2] = (
+        sigma1p_sq
+        + sigma2p_sq
+        - 2 * rhop * sigma1p * sigma2p
+        + mu2p_sq
+        + mu1p_sq
+        - 2 * mu1p * mu2p
+        - sigma1m_sq
+        - sigma2m_sq
+        + 2 * rhom * sigma1m * sigma2m
+        - mu2m_sq
+        - mu1m_sq
+        + 2 * mu1m * mu2m
+        - 1000
+    )
+    return moments
+
+
+def sim_moment_jacobian(params: np.ndarray) -> np.ndarray:
+    """Jacobian of the moment conditions in sim_moment_conditions().
+
+    Args:
+        params (np.ndarray): Parameter values.
+
+    Returns:
+        np.ndarray: 3 x 10 matrix of derivatives of the moment equations (rows)
+            with respect to the parameters (columns).
+    """
+    sigma1p, sigma2p, rhop, mu1p, mu2p, sigma1m, sigma2m, rhom, mu1m, mu2m = (
+        np.asarray(params).tolist()
+    )
 
     return np.array(
         [
-            sigma2p**2 + mu2p**2 + mu2p - sigma2m**2 - mu2m**2 - mu2m,
-            sigma1p**2 + mu1p**2 + mu1p - sigma1m**2 - mu1m**2 - mu1m,
-            sigma1p**2
-            + sigma2p**2
-            - 2 * rhop * sigma1p * sigma2p
-            + mu2p**2
-            + mu1p**2
-            - 2 * mu1p * mu2p
-            - sigma1m**2
-            - sigma2m**2
-            + 2 * rhom * sigma1m * sigma2m
-            - mu2m**2
-            - mu1m**2
-            + 2 * mu1m * mu2m
-            - 1000,
-        ]
+            [0, 2 * sigma2p, 0, 0, 2 * mu2p + 1, 0, -2 * sigma2m, 0, 0, -2 * mu2m - 1],
+            [2 * sigma1p, 0, 0, 2 * mu1p + 1, 0, -2 * sigma1m, 0, 0, -2 * mu1m - 1, 0],
+            [
+                2 * (sigma1p - rhop * sigma2p),
+                2 * (sigma2p - rhop * sigma1p),
+                -2 * sigma1p * sigma2p,
+                2 * (mu1p - mu2p),
+                2 * (mu2p - mu1p),
+                -2 * (sigma1m - rhom * sigma2m),
+                -2 * (sigma2m - rhom * sigma1m),
+                2 * sigma1m * sigma2m,
+                -2 * (mu1m - mu2m),
+                -2 * (mu2m - mu1m),
+            ],
+        ],
+        dtype=float,
     )
 
 
@@ -92,16 +139,51 @@ def process_mu_sigma_params(params: np.ndarray) -> dict:
     }
 
 
-# Constraints on data-generating process parameters
+# Constraints on data-generating process parameters. All are linear, so their
+# gradients are constant rows of the identity and are supplied to the optimizer
+# instead of being approximated by finite differences
+_param_basis = np.eye(10)
 constraints = [
-    {"type": "ineq", "fun": lambda vars: vars[0]},  # sigma_{1+} >= 0
-    {"type": "ineq", "fun": lambda vars: vars[1]},  # sigma_{2+} >= 0
-    {"type": "ineq", "fun": lambda vars: 1 - vars[2]},  # rho_+ <= 1
-    {"type": "ineq", "fun": lambda vars: vars[2] + 1},  # rho_+ >= -1
-    {"type": "ineq", "fun": lambda vars: vars[5]},  # sigma_{1-} >= 0
-    {"type": "ineq", "fun": lambda vars: vars[6]},  # sigma_{2-} >= 0
-    {"type": "ineq", "fun": lambda vars: 1 - vars[7]},  # rho_- <= 1
-    {"type": "ineq", "fun": lambda vars: vars[7] + 1},  # rho_- >= -1
+    {  # sigma_{1+} >= 0
+        "type": "ineq",
+        "fun": lambda vars: vars[0],
+        "jac": lambda vars: _param_basis[0],
+    },
+    {  # sigma_{2+} >= 0
+        "type": "ineq",
+        "fun": lambda vars: vars[1],
+        "jac": lambda vars: _param_basis[1],
+    },
+    {  # rho_+ <= 1
+        "type": "ineq",
+        "fun": lambda vars: 1 - vars[2],
+        "jac": lambda vars: -_param_basis[2],
+    },
+    {  # rho_+ >= -1
+        "type": "ineq",
+        "fun": lambda vars: vars[2] + 1,
+        "jac": lambda vars: _param_basis[2],
+    },
+    {  # sigma_{1-} >= 0
+        "type": "ineq",
+        "fun": lambda vars: vars[5],
+        "jac": lambda vars: _param_basis[5],
+    },
+    {  # sigma_{2-} >= 0
+        "type": "ineq",
+        "fun": lambda vars: vars[6],
+        "jac": lambda vars: _param_basis[6],
+    },
+    {  # rho_- <= 1
+        "type": "ineq",
+        "fun": lambda vars: 1 - vars[7],
+        "jac": lambda vars: -_param_basis[7],
+    },
+    {  # rho_- >= -1
+        "type": "ineq",
+        "fun": lambda vars: vars[7] + 1,
+        "jac": lambda vars: _param_basis[7],
+    },
 ]
 
 # Initial guess for parameters
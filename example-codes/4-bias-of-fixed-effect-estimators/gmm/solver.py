@@ -29,6 +29,10 @@ class GMMSolver:
         process_func (Callable[[np.ndarray], dict[str, np.array| np.float]] | None):
             function that processes the optimized parameters into a meaningful format.
             Defaults to NOne.
+        moment_jacobian (Callable[[np.ndarray], np.ndarray] | None): function
+            returning the Jacobian of the moment conditions, one row per
+            moment. If given, the optimizer uses the exact gradient of the
+            objective instead of finite differences. Defaults to None.
         estimated_params (np.ndarray | None):
             The estimated parameters after optimization.
     """
@@ -41,6 +45,7 @@ class GMMSolver:
         weighting_matrix: np.ndarray | None = None,
         process_func: Callable[[np.ndarray], dict[str, np.ndarray | np.floating]]
         | None = None,
+        moment_jacobian: Callable[[np.ndarray], np.ndarray] | None = None,
     ) -> None:
         self.moment_conditions = moment_conditions
         self.initial_guess = np.array(initial_guess)
@@ -51,8 +56,28 @@ class GMMSolver:
             else weighting_matrix
         )
         self.process_func = process_func
+        self.moment_jacobian = moment_jacobian
         self.estimated_params: np.ndarray = np.empty(self.initial_guess.shape)
 
+        # The objective is evaluated many times for a fixed weighting matrix,
+        # so its structure is detected once to make each evaluation cheap:
+        # identity and diagonal matrices need no matrix product, while for
+        # other positive definite matrices W = L Lᵀ, m(θ)ᵀ W m(θ) = |Lᵀ m(θ)|²
+        self._weights_diag: np.ndarray | None = None
+        self._weights_chol: np.ndarray | None = None
+        if weighting_matrix is None:
+            self._weights_kind = "identity"
+        elif np.allclose(weighting_matrix, np.diag(np.diag(weighting_matrix))):
+            self._weights_kind = "diag"
+            self._weights_diag = np.diag(weighting_matrix).copy()
+        else:
+            try:
+                self._weights_chol = np.linalg.cholesky(weighting_matrix)
+                self._weights_kind = "chol"
+            except np.linalg.LinAlgError:
+                # Not positive definite: use the quadratic form as is
+                self._weights_kind = "full"
+
     def _gmm_objective(self, params: np.ndarray) -> float:
         """Computes the GMM objective function:
                 m(θ)ᵀ W m(θ)
@@ -65,12 +90,42 @@ class GMMSolver:
             float: The GMM loss function value.
         """
         moments = self.moment_conditions(params)
-        return float(moments.T @ self.weighting_matrix @ moments)
+        if self._weights_kind == "identity":
+            return float(np.dot(moments, moments))
+        if self._weights_kind == "diag":
+            return float(np.dot(moments, self._weights_diag * moments))
+        if self._weights_kind == "chol":
+            scaled_moments = self._weights_chol.T @ moments
+            return float(np.dot(scaled_moments, scaled_moments))
+        return float(moments @ self.weighting_matrix @ moments)
+
+    def _gmm_gradient(self, params: np.ndarray) -> np.ndarray:
+        """Computes the gradient of the GMM objective function:
+                J(θ)ᵀ (W + Wᵀ) m(θ)
+        where J(θ) is the Jacobian of the moment conditions m(θ).
+
+        Args:
+            params (np.ndarray): Current parameter estimates.
+
+        Returns:
+            np.ndarray: The gradient of the GMM loss function.
+        """
+        moments = self.moment_conditions(params)
+        jacobian = self.moment_jacobian(params)
+        if self._weights_kind == "identity":
+            return 2 * (jacobian.T @ moments)
+        if self._weights_kind == "diag":
+            return 2 * (jacobian.T @ (self._weights_diag * moments))
+        symmetrized_weights = self.weighting_matrix + self.weighting_matrix.T
+        return jacobian.T @ (symmetrized_weights @ moments)
 
     def minimize(self) -> None:
         """Runs the GMM estimation by minimizing the GMM objective function."""
         result = minimize(
-            self._gmm_objective, self.initial_guess, constraints=self.constraints
+            self._gmm_objective,
+            self.initial_guess,
+            jac=self._gmm_gradient if self.moment_jacobian is not None else None,
+            constraints=self.constraints,
         )
 
         if not result.success:
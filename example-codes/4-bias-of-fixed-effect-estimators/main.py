@@ -18,8 +18,10 @@ Output:
 """
 
 import os
-from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures import ProcessPoolExecutor
+from itertools import product, repeat
 
+import numpy as np
 import pandas as pd
 from tqdm import tqdm
 
@@ -32,6 +34,7 @@ from dgp.moment_info import (
     param_initial_guess,
     process_mu_sigma_params,
     sim_moment_conditions,
+    sim_moment_jacobian,
 )
 from gmm.solver import GMMSolver
 from simulation_infrastructure.constants import (
@@ -55,33 +58,40 @@ def main() -> None:
         param_initial_guess,
         constraints,
         process_func=process_mu_sigma_params,
+        moment_jacobian=sim_moment_jacobian,
     )
     solver_dgp_params.minimize()
     mu_sigma_params = solver_dgp_params.process_solution()
 
-    # Run simulations in parallel
-    all_results = []
+    # Run simulations in parallel. Each task is a single (seed, sample size)
+    # pair, so that work can be spread over more cores than there are seeds
+    task_seeds, task_n_values = zip(
+        *(
+            (seed, N_VALUES[n_values_id : n_values_id + 1])
+            for seed, n_values_id in product(SEEDS, range(len(N_VALUES)))
+        )
+    )
     with ProcessPoolExecutor() as executor:
-        futures = {
-            executor.submit(
-                run_simulation_for_seed,
-                seed,
-                N_REPLICATIONS,
-                N_VALUES,
-                BETA_MEAN,
-                mu_sigma_params,
-            )
-            for seed in SEEDS
-        }
-        # Collect results as they complete, with a progress bar
-        for future in tqdm(
-            as_completed(futures), total=len(futures), desc="Running simulations"
-        ):
-            result = future.result()
-            all_results.append(result)
+        results = executor.map(
+            run_simulation_for_seed,
+            task_seeds,
+            repeat(N_REPLICATIONS),
+            task_n_values,
+            repeat(BETA_MEAN),
+            repeat(mu_sigma_params),
+        )
+        # Collect results in task order, with a progress bar
+        all_results = list(
+            tqdm(results, total=len(task_seeds), desc="Running simulations")
+        )
 
-    # Combine results and export plots
-    sim_results = pd.concat(all_results)
+    # Combine results column by column into a single frame and export plots
+    sim_results = pd.DataFrame(
+        {
+            column: np.concatenate([result[column] for result in all_results])
+            for column in all_results[0]
+        }
+    )
     plot_kdes(sim_results, OUTPUT_DIR)
 
 
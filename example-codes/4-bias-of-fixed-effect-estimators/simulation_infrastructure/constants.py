@@ -4,14 +4,12 @@ This module contains the constants used for specifying the simulation process
 Constants:
 - N_REPLICATIONS (int): Number of replications for each seed.
 - OUTPUT_DIR (str): Directory where the simulation results will be saved.
-- SEEDS (list of int): List of seeds for random number generation to ensure 
+- SEEDS (tuple of int): Seeds for random number generation to ensure 
     reproducibility.
 """
 
 from pathlib import Path
 
-import numpy as np
-
 N_REPLICATIONS = 250
-SEEDS = N_REPLICATIONS * np.arange(8)
+SEEDS = tuple(N_REPLICATIONS * i for i in range(8))
 OUTPUT_DIR = Path() / "results"
@@ -0,0 +1,119 @@
+"""
+This module contains the estimators compared in the simulation: OLS without
+an intercept and the one-way fixed effects (within) estimator.
+
+Both regress the outcome on a single covariate, so estimates and their
+standard errors have closed forms. Results match those of
+pyfixest.feols("outcome ~ covariate", drop_intercept=True) and
+pyfixest.feols("outcome ~ covariate|Unit") with iid standard errors, without
+building design matrices from formulas.
+
+The estimators run on many samples at once: the rows of all samples are
+stacked, and a vector of sample identifiers tells which sample each row
+belongs to. All sums over samples (and units) are then computed together.
+
+Functions:
+    - ols_no_intercept(): OLS estimates and lower confidence bounds.
+    - fixed_effects_ols(): FE estimates and lower confidence bounds.
+"""
+
+import numpy as np
+from scipy.stats import t
+
+
+def _slopes_and_lower_bounds(
+    outcome: np.ndarray,
+    covariate: np.ndarray,
+    sample: np.ndarray,
+    df: np.ndarray,
+    alpha: float,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Regressions through the origin with iid standard errors, by sample.
+
+    Args:
+        outcome (np.ndarray): outcome values.
+        covariate (np.ndarray): covariate values.
+        sample (np.ndarray): sample identifiers, integers 0, ..., S-1.
+        df (np.ndarray): residual degrees of freedom of each sample.
+        alpha (float): 1-alpha is the nominal coverage of the intervals.
+
+    Returns:
+        tuple: slope estimates and lower limits of their confidence intervals,
+            one for each sample.
+    """
+    covariate_ss = np.bincount(sample, weights=covariate * covariate)
+    coefs = np.bincount(sample, weights=covariate * outcome) / covariate_ss
+    resids = outcome - coefs[sample] * covariate
+    resids_ss = np.bincount(sample, weights=resids * resids)
+    std_errs = np.sqrt(resids_ss / df / covariate_ss)
+    return coefs, coefs - t.ppf(1 - alpha / 2, df) * std_errs
+
+
+def ols_no_intercept(
+    outcome: np.ndarray,
+    covariate: np.ndarray,
+    sample: np.ndarray,
+    alpha: float = 0.05,
+) -> tuple[np.ndarray, np.ndarray]:
+    """OLS regressions of outcome on covariate without an intercept.
+
+    Args:
+        outcome (np.ndarray): outcome values.
+        covariate (np.ndarray): covariate values.
+        sample (np.ndarray): sample identifiers, integers 0, ..., S-1.
+        alpha (float, optional): 1-alpha is the nominal coverage of the
+            intervals. Defaults to 0.05.
+
+    Returns:
+        tuple: coefficient estimates and lower limits of their confidence
+            intervals, one for each sample.
+    """
+    df = np.bincount(sample) - 1
+    return _slopes_and_lower_bounds(outcome, covariate, sample, df, alpha)
+
+
+def fixed_effects_ols(
+    outcome: np.ndarray,
+    covariate: np.ndarray,
+    unit: np.ndarray,
+    sample: np.ndarray,
+    alpha: float = 0.05,
+) -> tuple[np.ndarray, np.ndarray]:
+    """One-way fixed effects regressions of outcome on covariate.
+
+    The unit effects are absorbed by the within transformation: outcome and
+    covariate are demeaned within each unit, and the demeaned outcome is
+    regressed on the demeaned covariate. Degrees of freedom account for the
+    absorbed unit effects.
+
+    Args:
+        outcome (np.ndarray): outcome values.
+        covariate (np.ndarray): covariate values.
+        unit (np.ndarray): unit identifiers, non-negative integers, distinct
+            across samples. Units without observations are ignored.
+        sample (np.ndarray): sample identifiers, integers 0, ..., S-1.
+        alpha (float, optional): 1-alpha is the nominal coverage of the
+            intervals. Defaults to 0.05.
+
+    Returns:
+        tuple: coefficient estimates and lower limits of their confidence
+            intervals, one for each sample.
+    """
+    # Unit identifiers index the unit sums directly, so the within
+    # transformation needs one pass over the data and no sorting
+    unit_sizes = np.bincount(unit)
+    with np.errstate(invalid="ignore"):
+        demeaned = [
+            values - (np.bincount(unit, weights=values) / unit_sizes)[unit]
+            for values in (outcome, covariate)
+        ]
+
+    # Count the units of each sample: first map units to their sample
+    unit_sample = np.zeros(unit_sizes.size, dtype=sample.dtype)
+    unit_sample[unit] = sample
+    num_units = np.bincount(
+        unit_sample[unit_sizes > 0], minlength=sample.max(initial=-1) + 1
+    )
+
+    df = np.bincount(sample) - num_units - 1
+    return _slopes_and_lower_bounds(*demeaned, sample, df, alpha)
@@ -9,8 +9,10 @@ This module contains the following functions:
 from pathlib import Path
 
 import matplotlib.pyplot as plt
+import numpy as np
 import pandas as pd
-import seaborn as sns
+from matplotlib.colors import to_rgba
+from scipy.stats import gaussian_kde
 
 plt.rcParams["font.family"] = "sans-serif"
 
@@ -27,38 +29,44 @@ def plot_kdes(sim_results: pd.DataFrame, output_dir: Path):
     colors = {"No Fixed Effects": "#ffe34d", "With Fixed Effects": "#3c165c"}
     linestyles = {"No Fixed Effects": "-", "With Fixed Effects": "--"}
     bg_color = "whitesmoke"
+    x_limits = (-0.6, 0.75)
 
     # Extract characteristics of data
     n_values = sim_results.n_units.unique()
     est_names = sim_results.model.unique()
 
+    # Split estimates by sample size and estimator in a single pass
+    grouped = sim_results.groupby(["n_units", "model"], sort=False)["coef_est"]
+    estimates = {key: group.to_numpy() for key, group in grouped}
+
     # Create figure
     fig, axs = plt.subplots(nrows=1, ncols=len(n_values), figsize=(12, 3.6))
     fig.patch.set_facecolor(bg_color)
 
     # Add KDEs for each value of N
     for ax_id, ax in enumerate(axs):
-        # Extract data corresponding to current N
-        sim_results_for_n = sim_results.loc[
-            sim_results["n_units"] == n_values[ax_id], ["model", "coef_est"]
-        ]
-
         # Background color gradient
         ax.set_facecolor(bg_color)
 
         for y in est_names:
-            a = sns.kdeplot(
-                sim_results_for_n.loc[
-                    sim_results_for_n["model"] == y, "coef_est"
-                ].squeeze(),
-                ax=ax,
-                bw_adjust=2,
-                label=y,
-                color=colors[y],
-                fill=True,
-                alpha=0.5,
+            # Gaussian KDE with twice the bandwidth of Scott's rule, evaluated
+            # up to three bandwidths beyond the data
+            values = estimates[(n_values[ax_id], y)]
+            density = gaussian_kde(values, bw_method=2 * values.size ** (-1 / 5))
+            bandwidth = np.sqrt(density.covariance[0, 0])
+            grid = np.linspace(
+                values.min() - 3 * bandwidth, values.max() + 3 * bandwidth, 200
+            )
+            area = ax.fill_between(
+                grid,
+                density(grid),
+                facecolor=to_rgba(colors[y], 0.5),
+                edgecolor=colors[y],
                 linestyle=linestyles[y],
+                label=y,
             )
+            # Start the density axis at zero
+            area.sticky_edges.y[:] = [0]
 
         # Add a line at y = 1
         ax.axvline(-0.25, color="black", alpha=0.5, linestyle=":")
@@ -76,7 +84,7 @@ def plot_kdes(sim_results: pd.DataFrame, output_dir: Path):
             ax.get_yaxis().set_visible(False)
 
         ax.set_xlabel(" ", fontsize=12, color="black")
-        ax.set_xlim(-0.6, 0.75)
+        ax.set_xlim(*x_limits)
 
         # Generate one legend
         if ax_id == len(n_values) - 1:
@@ -7,14 +7,13 @@ execution of simulation iterations.
 
 Functions:
     - run_simulation_for_seed(): runs Monte Carlo for a given seed and returns
-        the results
+        the results as columns of a results table
 """
 
 import numpy as np
-import pandas as pd
-import pyfixest as pf
 
-from dgp.data_generation import generate_data
+from dgp.data_generation import generate_panel_arrays
+from simulation_infrastructure.estimators import fixed_effects_ols, ols_no_intercept
 
 
 def run_simulation_for_seed(
@@ -23,7 +22,7 @@ def run_simulation_for_seed(
     n_values: np.ndarray,
     beta_mean: float,
     mu_sigma_params: dict[str, np.ndarray | np.floating],
-) -> pd.DataFrame:
+) -> dict[str, np.ndarray]:
     """
     Runs simulations for OLS vs. FE for given seed.
 
@@ -39,46 +38,74 @@ def run_simulation_for_seed(
             - "sigma_minus" (np.ndarray): Covariance for X when effect is -1.
 
     Returns:
-        pd.DataFrame: Monte Carlo results for given seed.
+        dict[str, np.ndarray]: Monte Carlo results for given seed, as columns
+            "seed", "replication", "n_units", "model", "coef_est", "ci_lower".
     """
-    results = []
+    # Preallocate result columns: two rows (models) per replication, with
+    # replications of each sample size in a contiguous block
+    rows_per_n = 2 * n_replications
+    coef_est = np.empty(rows_per_n * len(n_values))
+    ci_lower = np.empty(rows_per_n * len(n_values))
 
-    for n_units in n_values:
-        for replication in range(n_replications):
-            # Generate data
-            data = generate_data(
+    for n_units_id, n_units in enumerate(n_values):
+        # Independent random streams for all replications, spawned from the
+        # seed and the sample size. Unlike seeds of the form seed + replication,
+        # streams of different tasks never coincide
+        replication_seeds = np.random.SeedSequence(
+            seed, spawn_key=(int(n_units),)
+        ).spawn(n_replications)
+
+        # Generate data for all replications
+        panels = [
+            generate_panel_arrays(
                 n_units,
                 beta_mean,
                 mu_sigma_params,
-                seed=seed + replication,
+                seed=replication_seed,
             )
+            for replication_seed in replication_seeds
+        ]
 
-            fit_no_effect = pf.feols(
-                "outcome ~ covariate", data=data, drop_intercept=True
-            )
-            fit_effect = pf.feols("outcome ~ covariate|Unit", data=data)
+        # Stack replications, labeling rows by replication. Units are
+        # renumbered to be distinct across replications
+        outcome = np.concatenate([panel["outcome"] for panel in panels])
+        covariate = np.concatenate([panel["covariate"] for panel in panels])
+        replication = np.repeat(
+            np.arange(n_replications), [panel["Unit"].size for panel in panels]
+        )
+        unit_offsets = np.cumsum(
+            [0] + [panel["Unit"].max(initial=-1) + 1 for panel in panels[:-1]]
+        )
+        unit = np.concatenate(
+            [panel["Unit"] + offset for panel, offset in zip(panels, unit_offsets)]
+        )
 
-            # Collect results
-            results.append(
-                {
-                    "seed": seed,
-                    "replication": replication,
-                    "n_units": n_units,
-                    "model": "No Fixed Effects",
-                    "coef_est": fit_no_effect.coef().iloc[0],
-                    "ci_lower": fit_no_effect.confint().iloc[0, 0],
-                }
-            )
-            results.append(
-                {
-                    "seed": seed,
-                    "replication": replication,
-                    "n_units": n_units,
-                    "model": "With Fixed Effects",
-                    "coef_est": fit_effect.coef().iloc[0],
-                    "ci_lower": fit_effect.confint().iloc[0, 0],
-                }
-            )
+        # Fit both estimators in all replications at once
+        coef_no_effect, ci_lower_no_effect = ols_no_intercept(
+            outcome, covariate, replication
+        )
+        coef_effect, ci_lower_effect = fixed_effects_ols(
+            outcome, covariate, unit, replication
+        )
+
+        # Collect results, alternating between models
+        block = slice(n_units_id * rows_per_n, (n_units_id + 1) * rows_per_n)
+        coef_est[block][0::2] = coef_no_effect
+        coef_est[block][1::2] = coef_effect
+        ci_lower[block][0::2] = ci_lower_no_effect
+        ci_lower[block][1::2] = ci_lower_effect
 
-    # Return results as a dataframe
-    return pd.DataFrame(results)
+    # Return results as columns, to be combined across seeds by the caller
+    return {
+        "seed": np.full(coef_est.size, seed),
+        "replication": np.tile(
+            np.repeat(np.arange(n_replications), 2), len(n_values)
+        ),
+        "n_units": np.repeat(n_values, rows_per_n),
+        "model": np.tile(
+            ["No Fixed Effects", "With Fixed Effects"],
+            n_replications * len(n_values),
+        ),
+        "coef_est": coef_est,
+        "ci_lower": ci_lower,
+    }
@@ -10,8 +10,18 @@ Classes in this module:
 import numpy as np
 from imblearn.over_sampling import SMOTE
 from imblearn.pipeline import Pipeline as ImbPipeline
+from sklearn import config_context
 from sklearn.linear_model import LogisticRegression
 
+# Solver settings shared by all logistic regressions. liblinear is fast on the
+# small dense feature matrices of the simulation
+SOLVER_KWARGS = {"solver": "liblinear", "max_iter": 200, "tol": 1e-3}
+
+# Features come from the simulation DGPs and hyperparameters are fixed above,
+# so scikit-learn may skip its finiteness and hyperparameter checks. The
+# configuration is thread-local and is therefore set around each call
+SKLEARN_CONFIG = {"assume_finite": True, "skip_parameter_validation": True}
+
 
 class LogisticRegressionSK:
     """Logistic regression classifier with optional class weighting.
@@ -31,9 +41,12 @@ class LogisticRegressionSK:
     ) -> None:
         self.class_weight = class_weight
         self.model = LogisticRegression(
-            class_weight=class_weight, random_state=random_state
+            class_weight=class_weight, random_state=random_state, **SOLVER_KWARGS
+        )
+        self.name = (
+            f"LogisticRegression (class_weight={self.class_weight}, "
+            f"solver={SOLVER_KWARGS['solver']})"
         )
-        self.name = f"LogisticRegression (class_weight={self.class_weight})"
 
     def fit(self, X: np.ndarray, y: np.ndarray) -> None:
         """Fit the logistic regression model to the training data.
@@ -42,7 +55,8 @@ class LogisticRegressionSK:
             X (np.ndarray): training features.
             y (np.ndarray): training labels.
         """
-        self.model.fit(X, y)
+        with config_context(**SKLEARN_CONFIG):
+            self.model.fit(X, y)
 
     def predict(self, X: np.ndarray) -> np.ndarray:
         """Predict labels for the test data.
@@ -53,7 +67,8 @@ class LogisticRegressionSK:
         Returns:
             np.ndarray: predicted labels.
         """
-        return self.model.predict(X)
+        with config_context(**SKLEARN_CONFIG):
+            return self.model.predict(X)
 
 
 class LogisticRegressionSMOTE:
@@ -69,11 +84,23 @@ class LogisticRegressionSMOTE:
         self,
         random_state: int | None = None,
     ) -> None:
-        self.name = "Logistic Regression with SMOTE"
+        self.name = (
+            f"Logistic Regression with SMOTE (solver={SOLVER_KWARGS['solver']})"
+        )
         self.model = ImbPipeline(
             [
-                ("smote", SMOTE(random_state=random_state)),
-                ("logistic", LogisticRegression(random_state=random_state)),
+                (
+                    "smote",
+                    SMOTE(
+                        sampling_strategy="auto",
+                        k_neighbors=5,
+                        random_state=random_state,
+                    ),
+                ),
+                (
+                    "logistic",
+                    LogisticRegression(random_state=random_state, **SOLVER_KWARGS),
+                ),
             ]
         )
 
@@ -84,7 +111,8 @@ class LogisticRegressionSMOTE:
             X (np.ndarray): training features.
             y (np.ndarray): training labels.
         """
-        self.model.fit(X, y)
+        with config_context(**SKLEARN_CONFIG):
+            self.model.fit(X, y)
 
     def predict(self, X: np.ndarray) -> np.ndarray:
         """Predict labels for the test data.
@@ -95,4 +123,5 @@ class LogisticRegressionSMOTE:
         Returns:
             np.ndarray: tredicted labels.
         """
-        return self.model.predict(X)
+        with config_context(**SKLEARN_CONFIG):
+            return self.model.predict(X)
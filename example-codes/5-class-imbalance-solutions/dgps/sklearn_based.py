@@ -35,25 +35,34 @@ class SKImbalancedTwoClassesDGP:
         self.weights = weights
         self.name = "SK unbalanced"
 
-    def sample(self, seed: int | None = None) -> list[np.ndarray]:
+    def sample(
+        self, seed: int | np.random.SeedSequence | None = None
+    ) -> list[np.ndarray]:
         """Sample from DGP with given seed.
 
         Args:
-            seed (int | None, optional): RNG seed. Defaults to None.
+            seed (int | np.random.SeedSequence | None, optional): RNG seed. An
+                integer seeds data generation and the train-test split
+                separately, a SeedSequence is used for a single random stream
+                shared by both. Defaults to None.
 
         Returns:
             list[np.ndarray]: list of X_train, X_test, y_train, y_test arrays.
         """
+        if isinstance(seed, np.random.SeedSequence):
+            random_state = np.random.RandomState(np.random.MT19937(seed))
+        else:
+            random_state = seed
         X, y = make_classification(
             n_samples=self.n_train_samples,
             n_features=self.num_features,
             n_redundant=0,
             weights=self.weights,
-            random_state=seed,
+            random_state=random_state,
         )
         prop_test_set = self.n_test_samples / (
             self.n_test_samples + self.n_train_samples
         )
         return train_test_split(
-            X, y, test_size=prop_test_set, random_state=seed, stratify=y
+            X, y, test_size=prop_test_set, random_state=random_state, stratify=y
         )
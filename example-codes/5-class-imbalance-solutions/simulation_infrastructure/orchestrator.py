@@ -15,7 +15,8 @@ class SimulationOrchestrator:
     Args:
         scenarios (list[SimulationScenario]): list of SimulationScenario objects
             that encode DGPs, algorithms, and associated arguments.
-        n_workers (int): number of threads for parallel execution. Defaults to 1.
+        n_workers (int): number of workers for parallel execution, see
+            SimulationRunner. Defaults to 1.
     """
 
     def __init__(
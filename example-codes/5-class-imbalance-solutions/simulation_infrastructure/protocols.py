@@ -11,7 +11,7 @@ class DGPProtocol(Protocol):
     """Protocol for data generating processes"""
 
     def sample(
-        self, seed: int | None
+        self, seed: int | np.random.SeedSequence | None
     ) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
         """Return (X_train, X_test, y_train, y_test)."""
         ...
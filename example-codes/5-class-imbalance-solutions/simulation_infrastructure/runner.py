@@ -5,16 +5,52 @@ Classes:
     - SimulationRunner: executes simulation scenario, potentially in parallel.
 """
 
-from concurrent.futures import ThreadPoolExecutor
+import sys
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from typing import Any, Type
 
+import numpy as np
 import pandas as pd
-from sklearn.metrics import accuracy_score, f1_score, precision_score, recall_score
 from tqdm import tqdm
 
 from simulation_infrastructure.protocols import AlgorithmProtocol, DGPProtocol
 
 
+def _binary_metrics(y_true: np.ndarray, y_pred: np.ndarray) -> dict[str, float]:
+    """Accuracy and per-class precision, recall, and F_1 for 0/1 labels.
+
+    All metrics are computed from a single confusion matrix. Undefined ratios
+    are set to zero, as with zero_division=0 in scikit-learn.
+
+    Args:
+        y_true (np.ndarray): true labels.
+        y_pred (np.ndarray): predicted labels.
+
+    Returns:
+        dict[str, float]: accuracy and metrics for class 0 and 1.
+    """
+    # Confusion matrix: rows index true labels, columns predicted labels
+    counts = np.bincount(2 * y_true + y_pred, minlength=4).reshape(2, 2)
+    true_pos = np.diag(counts)
+    pred_pos = counts.sum(axis=0)
+    actual_pos = counts.sum(axis=1)
+
+    with np.errstate(invalid="ignore"):
+        precision = np.nan_to_num(true_pos / pred_pos)
+        recall = np.nan_to_num(true_pos / actual_pos)
+        f1 = np.nan_to_num(2 * true_pos / (pred_pos + actual_pos))
+
+    return {
+        "accuracy": float(true_pos.sum() / counts.sum()),
+        "precision_0": float(precision[0]),
+        "recall_0": float(recall[0]),
+        "precision_1": float(precision[1]),
+        "recall_1": float(recall[1]),
+        "f1_0": float(f1[0]),
+        "f1_1": float(f1[1]),
+    }
+
+
 class SimulationRunner:
     """Runs Monte Carlo simulations for a given DGP and list of algorithms.
 
@@ -26,7 +62,13 @@ class SimulationRunner:
             dictionaries for initializing each algorithm, ordered in the same
             order as algorithm_types
         n_simulations (int): number of Monte Carlo simulations. Defaults to 1000.
-        n_workers (int): number of threads for parallel execution. Defaults to 1.
+        n_workers (int): number of workers for parallel execution. Workers are
+            threads if the interpreter runs without the GIL (python -X gil=0 on
+            a free-threaded build) and processes otherwise. Defaults to 1.
+        seed (int): root seed. Each simulation draws data from its own
+            independent stream, spawned from the root seed. Defaults to 0.
+        dgp (DGPProtocol): the DGP, shared by all simulations. Samples depend
+            only on the seed passed to dgp.sample().
     """
 
     def __init__(
@@ -37,6 +79,7 @@ class SimulationRunner:
         algorithm_kwargs_list: list[dict[str, Any]],
         n_simulations: int = 1000,
         n_workers: int = 1,
+        seed: int = 0,
     ):
         self.dgp_type = dgp_type
         self.dgp_kwargs = dgp_kwargs
@@ -44,16 +87,18 @@ class SimulationRunner:
         self.algorithm_kwargs_list = algorithm_kwargs_list
         self.n_simulations = n_simulations
         self.n_workers = n_workers
+        self.seed = seed
+        self.dgp = dgp_type(**dgp_kwargs)
         self.results = []
 
-    def _run_single_simulation(self, seed: int) -> dict[str, Any]:
+    def _run_single_simulation(self, seed: np.random.SeedSequence) -> dict[str, Any]:
         """Run a single Monte Carlo simulation for all algorithms.
 
         Args:
-            seed (int): seed for data sampling
+            seed (np.random.SeedSequence): seed for data sampling
         """
-        # Initialize DGP
-        dgp = self.dgp_type(**self.dgp_kwargs)
+        # Draw data
+        dgp = self.dgp
         X_train, X_test, y_train, y_test = dgp.sample(seed=seed)
 
         sim_results = {}
@@ -66,44 +111,60 @@ class SimulationRunner:
             algo.fit(X_train, y_train)
             y_pred = algo.predict(X_test)
 
-            accuracy = accuracy_score(y_test, y_pred)
-            precision_0 = precision_score(y_test, y_pred, pos_label=0, zero_division=0)
-            recall_0 = recall_score(y_test, y_pred, pos_label=0, zero_division=0)
-            precision_1 = precision_score(y_test, y_pred, pos_label=1, zero_division=0)
-            recall_1 = recall_score(y_test, y_pred, pos_label=1, zero_division=0)
-            f1_0 = f1_score(y_test, y_pred, pos_label=0, zero_division=0)
-            f1_1 = f1_score(y_test, y_pred, pos_label=1, zero_division=0)
-
             result_key = dgp.name + " + " + algo.name
             sim_results[result_key] = {
                 "n_training": dgp.n_train_samples,
                 "first_class_weight": dgp.weights[0],
-                "accuracy": accuracy,
-                "precision_0": precision_0,
-                "recall_0": recall_0,
-                "precision_1": precision_1,
-                "recall_1": recall_1,
-                "f1_0": f1_0,
-                "f1_1": f1_1,
+                **_binary_metrics(y_test, y_pred),
             }
 
         return sim_results
 
+    def _make_executor(self) -> Executor:
+        """Create a pool of workers for running simulations in parallel.
+
+        Simulations are CPU-bound, so threads only run in parallel if the GIL
+        is disabled. Otherwise each worker is a separate process.
+
+        Returns:
+            Executor: thread pool without the GIL, process pool with it.
+        """
+        gil_enabled = getattr(sys, "_is_gil_enabled", lambda: True)()
+        if gil_enabled:
+            return ProcessPoolExecutor(max_workers=self.n_workers)
+        return ThreadPoolExecutor(max_workers=self.n_workers)
+
     def run_all(self) -> pd.DataFrame:
         """Run all simulations in parallel and return aggregated results.
 
         Returns:
             pd.DataFrame: DataFrame with simulation results.
         """
-        with ThreadPoolExecutor(max_workers=self.n_workers) as executor:
-            futures = [
-                executor.submit(self._run_single_simulation, seed)
-                for seed in range(self.n_simulations)
-            ]
-            for future in tqdm(
-                futures, total=self.n_simulations, desc="Running simulations"
-            ):
-                self.results.append(future.result())
+        seeds = np.random.SeedSequence(self.seed).spawn(self.n_simulations)
+        if self.n_workers == 1:
+            # Run inline, without the cost of starting workers
+            self.results.extend(
+                tqdm(
+                    map(self._run_single_simulation, seeds),
+                    total=self.n_simulations,
+                    desc="Running simulations",
+                )
+            )
+        else:
+            with self._make_executor() as executor:
+                # Send seeds to workers in chunks to amortize communication
+                sim_results = executor.map(
+                    self._run_single_simulation,
+                    seeds,
+                    chunksize=max(1, self.n_simulations // (4 * self.n_workers)),
+                )
+                self.results.extend(
+                    tqdm(
+                        sim_results,
+                        total=self.n_simulations,
+                        desc="Running simulations",
+                    )
+                )
 
         # Aggregate results into a DataFrame
         df_list = []
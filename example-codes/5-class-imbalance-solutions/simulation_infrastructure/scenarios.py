@@ -18,7 +18,7 @@ from algorithms.logistic import LogisticRegressionSK, LogisticRegressionSMOTE
 from dgps.sklearn_based import SKImbalancedTwoClassesDGP
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SimulationScenario:
     """A single simulation scenario: DGP, list of algorithms, and associated arguments"""
 